@@ -0,0 +1,44 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import ufc_logger
+
+
+class NonStrKeyTest(unittest.TestCase):
+    """Details dicts with non-str keys serialize (as strings) with orjson and stdlib json."""
+
+    def backends(self):
+        if ufc_logger.orjson is not None:
+            yield "orjson", mock.patch.object(ufc_logger, "orjson", ufc_logger.orjson)
+        yield "json", mock.patch.object(ufc_logger, "orjson", None)
+
+    def test_dumps(self):
+        for name, patch in self.backends():
+            with self.subTest(backend=name), patch:
+                self.assertEqual(json.loads(ufc_logger._dumps({1: "a", 2.5: "b"})), {"1": "a", "2.5": "b"})
+                self.assertEqual(json.loads(ufc_logger._dumps({1: "a"}, pretty=True)), {"1": "a"})
+
+    def test_int_keyed_details_are_saved(self):
+        cwd = os.getcwd()
+        for name, patch in self.backends():
+            with self.subTest(backend=name), patch, tempfile.TemporaryDirectory() as tmp:
+                os.chdir(tmp)
+                try:
+                    lg = ufc_logger.UFCLogger()
+                    lg.log_event("x", {1: "a"})
+                    path = lg.save_log()
+                    lg.close()
+                    with gzip.open(path) as f:
+                        data = json.loads(f.read())
+                finally:
+                    os.chdir(cwd)
+                self.assertEqual(data["events"][0]["type"], "x")
+                self.assertEqual(data["events"][0]["details"], {"1": "a"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,12 @@ import os
 import csv
 import time
 import sys
+import functools
+import io
+import bisect
+import queue
+import threading
+from types import SimpleNamespace
 from ufc_logger import UFCLogger
 
 # ============ Configuration ============
@@ -36,9 +42,22 @@ COL = {
 
 # Snapping (meters)
 SNAP = {'hard': 0.20, 'soft': 0.60, 'pull': 0.60}
+# Smallest position change (meters) that counts as a move when recording a step
+MOVE_EPS = 1e-6
 
 CSV_HEADERS = ["entity", "label", "team", "x_m", "y_m"]
 
+# pick() result for the disc; player tags are prebuilt per roster (Scene._player_tags)
+DISC_TAG = ("disc", None)
+
+# Write buffer for CSV exports: large strategies go out in a few big writes
+EXPORT_BUFFER = 1 << 20
+
+# Posted by ExportWorker when a background CSV export finishes (attrs: kind, path)
+CSV_DONE = pygame.USEREVENT + 1
+# Posted when a log save queued by handle_save_log finishes (attrs: path, error)
+LOG_SAVED = pygame.USEREVENT + 2
+
 # ============ Utilities ============
 def clamp(v, lo, hi):
     return max(lo, min(hi, v))
@@ -48,30 +67,53 @@ def compute_scale(w, h):
     return min((w - 2*MARGIN_L) / FIELD_LEN,
                (h - 2*MARGIN_T - UI_BAR_H - RECORD_BAR_H + 8) / FIELD_WID)
 
-def handle_save_log(logger, toasts):
+def handle_save_log(logger):
+    # written in the background; the toast comes with the LOG_SAVED event
+    logger.save_log(note="log_saved")
+
+def post_log_saved(filepath, error):
+    """UFCLogger on_saved callback (runs on the logger's worker thread)"""
     try:
-        filepath = logger.save_log()
-        toasts.show(f"Log saved to {os.path.basename(filepath)}")
-        logger.log_system_event("log_saved", {"filepath": filepath})
-    except Exception as e:
-        toasts.show("Error saving log")
-        logger.log_error("save_log_error", str(e), "")
+        pygame.event.post(pygame.event.Event(LOG_SAVED, path=filepath,
+                                             error=None if error is None else str(error)))
+    except pygame.error:
+        pass  # display already shut down
 
-def dist_point_seg(px, py, x1, y1, x2, y2):
-    vx, vy = x2-x1, y2-y1
-    wx, wy = px-x1, py-y1
-    L2 = vx*vx + vy*vy
-    if not L2:
-        return math.hypot(px-x1, py-y1)
+def show_log_saved(e, toasts):
+    if e.error is not None:
+        toasts.show("Error saving log")
+    elif e.path is None:
+        toasts.show("Nothing to save yet", kind='info')
+    else:
+        toasts.show(f"Log saved to {os.path.basename(e.path)}")
 
-    t = clamp((wx*vx+wy*vy) / L2, 0, 1)
-    return math.hypot(px - (x1 + t * vx), py - (y1 + t * vy))
+@functools.lru_cache(maxsize=512)
+def render_text(font, text, color):
+    """Memoized antialiased font.render; returned surfaces are shared, so only blit them."""
+    return font.render(text, True, color)
 
 def ensure_csv_ext(name):
     if not name.lower().endswith('.csv'):
         return name + '.csv'
     return name
 
+def to_display_format(surf):
+    """Convert a cached surface to the display's pixel format (keeping per-pixel alpha)
+    so repeated blits take the fast path; no-op before a window exists."""
+    if pygame.display.get_surface() is None:
+        return surf
+    return surf.convert_alpha() if surf.get_flags() & pygame.SRCALPHA else surf.convert()
+
+_DIM_OVERLAY = None
+
+def get_dim_overlay(size):
+    """Translucent backdrop shared by the modal dialogs; rebuilt only when `size` changes."""
+    global _DIM_OVERLAY
+    if _DIM_OVERLAY is None or _DIM_OVERLAY.get_size() != size:
+        _DIM_OVERLAY = to_display_format(pygame.Surface(size, pygame.SRCALPHA))
+        _DIM_OVERLAY.fill((0,0,0,160))
+    return _DIM_OVERLAY
+
 # ============ UI Components ============
 class Button:
     def __init__(self, rect, text):
@@ -100,7 +142,7 @@ class Button:
         pygame.draw.rect(surf, (0,0,0), self.rect, 2, border_radius=self.corner_radius)
         # icon + text
         txt = f"{(self.icon + ' ') if self.icon else ''}{self.text}"
-        lbl = font.render(txt, True, (255,255,255))
+        lbl = render_text(font, txt, (255,255,255))
         surf.blit(lbl, (self.rect.centerx-lbl.get_width()//2, self.rect.centery-lbl.get_height()//2))
     
     def update(self, pos):
@@ -115,16 +157,17 @@ class Toasts:
         self.q = []
     def show(self, text, sec=2.2, kind=None):
         # kind: 'success', 'warn', 'info'
-        self.q.append((text, time.time()+sec, kind))
+        self.q.append((text, time.monotonic()+sec, kind))
     
-    def draw(self, screen, font):
+    def draw(self, screen, font, now=None):
         # keep only active toasts
-        now = time.time()
+        if now is None:
+            now = time.monotonic()
         self.q = [(t,e,k) for t,e,k in self.q if e>now]
         if not self.q:
             return
         text, _, kind = self.q[-1]
-        lbl = font.render(text, True, (255,255,255))
+        lbl = render_text(font, text, (255,255,255))
         w, h = lbl.get_width()+24, lbl.get_height()+14
         x, y = WIN_W//2-w//2, MARGIN_T-h-8 if MARGIN_T>24 else 8
         bg = pygame.Surface((w,h+8), pygame.SRCALPHA)
@@ -161,7 +204,7 @@ class ExportDialog:
         self.ok = Button((self.box.right-210, self.box.bottom-50, 90, 34), "OK")
         self.cancel = Button((self.box.right-110, self.box.bottom-50, 90, 34), "Cancel")
         self.cursor_on = True
-        self.last = time.time()
+        self.last = time.monotonic()
         self.focus = True
     
     def open(self):
@@ -172,23 +215,23 @@ class ExportDialog:
     def close(self):
         self.visible = False
     
-    def draw(self, screen):
+    def draw(self, screen, now=None):
         if not self.visible:
             return None
-        ov = pygame.Surface((WIN_W,WIN_H), pygame.SRCALPHA)
-        ov.fill((0,0,0,160))
-        screen.blit(ov, (0,0))
+        if now is None:
+            now = time.monotonic()
+        screen.blit(get_dim_overlay((WIN_W,WIN_H)), (0,0))
         pygame.draw.rect(screen, (34,34,40), self.box, border_radius=12)
         pygame.draw.rect(screen, (0,0,0), self.box, 2, border_radius=12)
-        screen.blit(self.font.render("Export configuration", True, (235,235,235)), (self.box.left+20, self.box.top+20))
-        screen.blit(self.small.render(f"Saving to: {CONFIG_DIR}", True, (210,210,210)), (self.box.left+20, self.box.top+44))
+        screen.blit(render_text(self.font, "Export configuration", (235,235,235)), (self.box.left+20, self.box.top+20))
+        screen.blit(render_text(self.small, f"Saving to: {CONFIG_DIR}", (210,210,210)), (self.box.left+20, self.box.top+44))
         pygame.draw.rect(screen, (54,54,60), self.input, border_radius=6)
         pygame.draw.rect(screen, (0,0,0), self.input, 2, border_radius=6)
-        txt = self.font.render(self.text, True, (240,240,240))
+        txt = render_text(self.font, self.text, (240,240,240))
         screen.blit(txt, (self.input.left+10, self.input.top+6))
-        if time.time()-self.last > 0.5:
+        if now-self.last > 0.5:
             self.cursor_on = not self.cursor_on
-            self.last = time.time()
+            self.last = now
         if self.focus and self.cursor_on:
             cx = self.input.left+10+txt.get_width()+2
             pygame.draw.line(screen, (255,255,255), (cx,self.input.top+6), (cx,self.input.bottom-6), 2)
@@ -238,18 +281,27 @@ class Picker:
         self.box = pygame.Rect(WIN_W//2-w//2, WIN_H//2-h//2, w, h)
     
     def files(self):
-        now = time.time()
+        now = time.monotonic()
         if not self._cache or now-self._cache.get('t',0) > 1.5:
-            lst = [f for f in os.listdir(CONFIG_DIR) if f.lower().endswith(".csv")]
-            info = [(f, os.path.getmtime(os.path.join(CONFIG_DIR,f))) for f in lst]
-            self._cache = {'t': now, 'v': info}
-        info = self._cache['v']
-        def _picker_key(x):
+            # scandir hands back the directory entries' stat data instead of one getmtime() per file
+            with os.scandir(CONFIG_DIR) as it:
+                info = [(e.name, e.stat().st_mtime) for e in it
+                        if e.name.lower().endswith(".csv") and e.is_file()]
+            if info == self._cache.get('v'):
+                # listing unchanged: keep the sorted results too
+                self._cache['t'] = now
+            else:
+                self._cache = {'t': now, 'v': info, 'sorted': {}}
+        # one memoized ordering per sort mode, dropped with the listing
+        by_sort = self._cache['sorted']
+        res = by_sort.get(self.sort)
+        if res is None:
             if self.sort.startswith("name"):
-                return x[0].lower()
-            return x[1]
-
-        return sorted(info, key=_picker_key, reverse=self.sort.endswith("desc"))
+                key = lambda x: x[0].lower()
+            else:
+                key = lambda x: x[1]
+            res = by_sort[self.sort] = sorted(self._cache['v'], key=key, reverse=self.sort.endswith("desc"))
+        return res
     
     def handle(self, e):
         if not self.visible:
@@ -290,13 +342,11 @@ class Picker:
     def draw(self, screen):
         if not self.visible:
             return None
-        ov = pygame.Surface((WIN_W,WIN_H), pygame.SRCALPHA)
-        ov.fill((0,0,0,160))
-        screen.blit(ov, (0,0))
+        screen.blit(get_dim_overlay((WIN_W,WIN_H)), (0,0))
         pygame.draw.rect(screen, (32,32,36), self.box, border_radius=12)
         pygame.draw.rect(screen, (0,0,0), self.box, 2, border_radius=12)
-        screen.blit(self.font.render(f"Import from: {CONFIG_DIR}", True, (230,230,230)), (self.box.left+16, self.box.top+16))
-        screen.blit(self.font.render(f"Sort: {self.sort}  (N/D, ↑/↓)", True, (200,200,200)), (self.box.left+16, self.box.top+36))
+        screen.blit(render_text(self.font, f"Import from: {CONFIG_DIR}", (230,230,230)), (self.box.left+16, self.box.top+16))
+        screen.blit(render_text(self.font, f"Sort: {self.sort}  (N/D, ↑/↓)", (200,200,200)), (self.box.left+16, self.box.top+36))
 
         mx, my = pygame.mouse.get_pos()
         items = self.files()
@@ -308,10 +358,10 @@ class Picker:
             hov = r.collidepoint(mx,my)
             pygame.draw.rect(screen, (60,60,66) if hov else (44,44,50), r, border_radius=6)
             stamp = time.strftime("%Y-%m-%d %H:%M", time.localtime(mt))
-            screen.blit(self.font.render(f"{fn}   —   {stamp}", True, (240,240,240)), (r.left+8, r.top+4))
+            screen.blit(render_text(self.font, f"{fn}   —   {stamp}", (240,240,240)), (r.left+8, r.top+4))
             # draw only; click handled in handle()
 
-        screen.blit(self.font.render("Click a file to import • ESC to cancel", True, (220,220,220)), (self.box.left+16, self.box.bottom-34))
+        screen.blit(render_text(self.font, "Click a file to import • ESC to cancel", (220,220,220)), (self.box.left+16, self.box.bottom-34))
         return None
 
 class Slider:
@@ -320,6 +370,9 @@ class Slider:
         self.min_v = self.max_v = self.value = 0.0
         self.dragging = False
         self.visible = self.enabled = False
+        # tick marks are static for a given range/size, so draw them once
+        self._ticks_surf = None
+        self._ticks_key = None
     
     def set_range(self, lo, hi):
         self.min_v, self.max_v = float(lo), float(hi)
@@ -355,6 +408,19 @@ class Slider:
             return self.value
         return None
     
+    def _build_ticks(self):
+        # one extra column so the tick at max_v (x == rect.right) isn't clipped
+        ticks = pygame.Surface((self.rect.w+1, self.rect.h), pygame.SRCALPHA)
+        left = self.rect.left
+        # Ticks: decimate when long
+        span = max(1, int(math.ceil(self.max_v - self.min_v)))
+        max_ticks = 80
+        step = 1 if span <= max_ticks else int(math.ceil(span / max_ticks))
+        for v in range(int(self.min_v), int(self.max_v)+1, step):
+            x = self._value_to_x(v) - left
+            pygame.draw.line(ticks, (200,200,200), (x, 4), (x, 10))
+        return to_display_format(ticks)
+
     def draw(self, surf, font):
         if not self.visible:
             return
@@ -366,30 +432,47 @@ class Slider:
         if kx > self.rect.left:
             played = pygame.Rect(self.rect.left+2, self.rect.top+4, kx - self.rect.left-4, self.rect.height-8)
             pygame.draw.rect(surf, (*COL['accent'],), played, border_radius=6)
-        # Ticks: decimate when long
-        span = max(1, int(math.ceil(self.max_v - self.min_v)))
-        max_ticks = 80
-        step = 1 if span <= max_ticks else int(math.ceil(span / max_ticks))
-        for v in range(int(self.min_v), int(self.max_v)+1, step):
-            x = self._value_to_x(v)
-            pygame.draw.line(surf, (200,200,200,100), (x, self.rect.top+4), (x, self.rect.top+10))
+        # Ticks (cached surface, redrawn only when range or size changes)
+        key = (self.min_v, self.max_v, self.rect.w, self.rect.h)
+        if self._ticks_key != key:
+            self._ticks_surf = self._build_ticks()
+            self._ticks_key = key
+        surf.blit(self._ticks_surf, self.rect.topleft)
         # Knob (bigger)
         knob_r = 13
         pygame.draw.circle(surf, COL['sel'] if self.dragging else COL['accent'], (kx, self.rect.centery), knob_r)
         pygame.draw.circle(surf, (0,0,0), (kx, self.rect.centery), knob_r, 2)
         # Label/timecode
-        lbl = font.render(f"Step: {int(self.value) if abs(self.value-round(self.value))<1e-6 else f'{self.value:.2f}'}", True, (235,235,235))
+        lbl = render_text(font, f"Step: {int(self.value) if abs(self.value-round(self.value))<1e-6 else f'{self.value:.2f}'}", (235,235,235))
         surf.blit(lbl, (self.rect.right+12, self.rect.centery-lbl.get_height()//2))
 
 # ============ Recording ============
 class RecordingManager:
+    KEYFRAME_EVERY = 32  # steps between replay-cursor keyframes
+
     def __init__(self):
         self.state = None
         self.data = {}
+        # recorded step numbers in ascending order, kept alongside self.data (see _steps)
+        self._sorted_steps = []
         self.step = self.max_step = 0.0
         # cache full snapshots to avoid rebuilding from deltas for every scrub
         # key: integer step -> {'players': {label: [x,y], ...}, 'disc': [x,y] or None}
         self._snapshot_cache = {}
+        # replay cursor: leader-only state after applying deltas 0.._cursor_step,
+        # so scrubbing forward applies just the new deltas (-1 = not built yet)
+        self._cursor_step = -1
+        self._cursor_players = {}
+        self._cursor_disc = None
+        self._cursor_moves = {}
+        # cursor state planted every KEYFRAME_EVERY steps: step -> (players, disc, moves)
+        self._keyframes = {}
+        # upper bound on every step cached above (snapshots or keyframes); lets
+        # append-only recording skip invalidation scans entirely
+        self._cache_hi = -1
+        # (t, scene._players_px list, scene._px_rev, scene._disc_px) of the last playback
+        # write; an unchanged t on the same untouched pixels means the scene already shows that frame
+        self._last_applied = None
 
         # ---------- NEW: temporary link data + move bookkeeping ----------
         # temp stores UI-ish/transient info; never exported to CSV directly
@@ -400,29 +483,47 @@ class RecordingManager:
         self._move_started_at = {}
         # cache: reverse map for quick follower lookup {leader: [(follower, delay), ...]}
         self._followers_cache = None
+        # every label that follows some leader; built with _followers_cache
+        self._follower_set = set()
         # -----------------------------------------------------------------
 
     def _rebuild_followers_cache(self):
-        """Build reverse map: leader -> list[(follower, delay)]."""
+        """Build reverse map: leader -> list[(follower, delay)], plus the set of all followers."""
         fol = {}
         for lead, fmap in self.temp.get('links', {}).items():
             for f, d in fmap.items():
                 fol.setdefault(lead, []).append((f, int(d)))
         self._followers_cache = fol
+        self._follower_set = {f for lst in fol.values() for f, _ in lst}
 
     # ---------- NEW: public helpers to manage links (used by Scene) ----------
     def link_players(self, leader_label, follower_label, delay_steps=1):
         """Create/overwrite a link: follower follows leader after delay_steps."""
         if leader_label == follower_label:
             return  # ignore self-link
-        self.temp.setdefault('links', {}).setdefault(leader_label, {})[follower_label] = int(max(0, delay_steps))
-        self._followers_cache = None  # invalidate
+        delay = int(max(0, delay_steps))
+        self.temp.setdefault('links', {}).setdefault(leader_label, {})[follower_label] = delay
+        fc = self._followers_cache
+        if fc is not None:
+            # keep the reverse map in step with temp['links'] (overwrite in place, else append)
+            lst = fc.setdefault(leader_label, [])
+            for i, (f, _) in enumerate(lst):
+                if f == follower_label:
+                    lst[i] = (follower_label, delay)
+                    break
+            else:
+                lst.append((follower_label, delay))
+            self._follower_set.add(follower_label)
+        self._invalidate_from(0)  # replay skips followers, so every snapshot changes
 
     def unlink_player(self, follower_label=None, leader_label=None):
         """Remove links by follower or leader. If both None -> no-op."""
+        fc = self._followers_cache
         if leader_label is not None:
             if leader_label in self.temp.get('links', {}):
                 del self.temp['links'][leader_label]
+            if fc is not None:
+                fc.pop(leader_label, None)
         if follower_label is not None:
             # remove follower from all leaders
             for lead in list(self.temp.get('links', {}).keys()):
@@ -430,9 +531,27 @@ class RecordingManager:
                     del self.temp['links'][lead][follower_label]
                     if not self.temp['links'][lead]:
                         del self.temp['links'][lead]
-        self._followers_cache = None
+                    if fc is not None:
+                        lst = [(f, d) for f, d in fc.get(lead, ()) if f != follower_label]
+                        if lst:
+                            fc[lead] = lst
+                        else:
+                            fc.pop(lead, None)
+        if fc is not None:
+            self._follower_set = {f for lst in fc.values() for f, _ in lst}
+        self._invalidate_from(0)
     # ------------------------------------------------------------------------
 
+    def _invalidate_from(self, t):
+        """Drop cached snapshots/keyframes at or after step `t` and rewind the cursor if needed."""
+        if t <= self._cache_hi:
+            self._snapshot_cache = {k: v for k, v in self._snapshot_cache.items() if k < t}
+            self._keyframes = {k: v for k, v in self._keyframes.items() if k < t}
+            self._cache_hi = t - 1
+        if self._cursor_step >= t:
+            self._cursor_step = -1
+        self._last_applied = None
+
     def reset(self):
         self.__init__()
         self._snapshot_cache.clear()
@@ -440,17 +559,31 @@ class RecordingManager:
     def start_recording(self):
         self.state = 'recording'
         self.data.clear()
+        self._sorted_steps = []
         self.step = self.max_step = 0.0
-        self._snapshot_cache.clear()
+        self._invalidate_from(0)
         self._move_started_at.clear()
 
+    def _steps(self):
+        """Recorded step numbers, ascending; re-sorted only if self.data was swapped out wholesale."""
+        steps = self._sorted_steps
+        if len(steps) != len(self.data):
+            steps = self._sorted_steps = sorted(self.data)
+        return steps
+
+    def _put_step(self, t, entry):
+        """Store the sparse entry for step `t`, keeping the sorted step index current."""
+        if t not in self.data:
+            bisect.insort(self._steps(), t)
+        self.data[t] = entry
+
     def _prev_full_snapshot(self, t_minus_1):
         """Utility: full snapshot at t-1 if it exists, else None."""
         if t_minus_1 < 0 or not self.data:
             return None
         if t_minus_1 == 0 and 0 in self.data:
             return self.build_snapshot(0)
-        if t_minus_1 in self.data or t_minus_1 <= max(self.data.keys()):
+        if t_minus_1 in self.data or t_minus_1 <= self._steps()[-1]:
             # build from cache + deltas
             return self.build_snapshot(t_minus_1)
         return None
@@ -468,8 +601,8 @@ class RecordingManager:
         # Always save full snapshot at step 0
         if t == 0 or prev_full is None:
             players_snap = {p['label']: [float(p['pos_m'][0]), float(p['pos_m'][1])] for p in scene.players}
-            self.data[t] = {'players': players_snap, 'disc': [float(scene.disc['pos_m'][0]), float(scene.disc['pos_m'][1])]}
-            self._snapshot_cache = {k: v for k, v in self._snapshot_cache.items() if k < t}
+            self._put_step(t, {'players': players_snap, 'disc': [float(scene.disc['pos_m'][0]), float(scene.disc['pos_m'][1])]})
+            self._invalidate_from(t)
             # initialize move-start map
             for lab, pos in players_snap.items():
                 self._move_started_at[lab] = t  # baseline
@@ -480,48 +613,58 @@ class RecordingManager:
         curr_map = {p['label']: [float(p['pos_m'][0]), float(p['pos_m'][1])] for p in scene.players}
         prev_map = prev_full.get('players', {}) if prev_full else {}
 
-        leaders_changed = []
+        prev_get = prev_map.get
         for lab, pos in curr_map.items():
-            pp = prev_map.get(lab)
-            if (pp is None) or (round(pp[0], 6) != round(pos[0], 6) or round(pp[1], 6) != round(pos[1], 6)):
+            pp = prev_get(lab)
+            if pp is None or abs(pp[0]-pos[0]) > MOVE_EPS or abs(pp[1]-pos[1]) > MOVE_EPS:
                 changed[lab] = pos
-                leaders_changed.append(lab)
+        leaders_changed = list(changed)
 
         # ---------- NEW: follower auto-move (only in recording state) ----------
         if self.state == 'recording' and changed:
-            if self._followers_cache is None:
-                self._rebuild_followers_cache()
-
             # mark/refresh move start times for leaders that changed at this step
+            move_started = self._move_started_at
             for lead in leaders_changed:
-                self._move_started_at[lead] = t
+                move_started[lead] = t
 
-            # For each changed leader, evaluate followers
-            for lead in leaders_changed:
-                followers = self._followers_cache.get(lead, [])
+            if self._followers_cache is None:
+                self._rebuild_followers_cache()
+            followers_cache = self._followers_cache
+            index_map = scene._player_index_map
+
+            # For each changed leader, evaluate followers (nothing to do without links).
+            # curr_map is updated as we go so chained leaders see their new position;
+            # the Scene writes are collected and applied once below.
+            moved = {}
+            for lead in (leaders_changed if followers_cache else ()):
+                followers = followers_cache.get(lead)
                 if not followers:
                     continue
                 leader_new = curr_map.get(lead)
-                start_t = self._move_started_at.get(lead, t)
+                start_t = move_started.get(lead, t)
 
                 for fol_lab, delay in followers:
                     # If enough steps have passed since leader started, teleport follower to leader's new position
-                    if (t - start_t) >= delay:
-                        # Update the Scene immediately so the UI shows the jump right after "Next Step"
-                        if fol_lab in curr_map:
-                            fx, fy = leader_new[0], leader_new[1]
-                            # mutate scene (meters + pixels)
-                            idx = scene._player_index_map.get(fol_lab)
-                            if idx is not None:
-                                scene.players[idx]['pos_m'] = [fx, fy]
-                                scene._players_px[idx] = scene.m2px(fx, fy)
-                                curr_map[fol_lab] = [fx, fy]
-                                changed[fol_lab] = [fx, fy]  # ensure saved this step
+                    if (t - start_t) >= delay and fol_lab in curr_map:
+                        idx = index_map.get(fol_lab)
+                        if idx is not None:
+                            pos = [leader_new[0], leader_new[1]]
+                            curr_map[fol_lab] = pos
+                            moved[fol_lab] = (idx, pos)
+
+            if moved:
+                # Update the Scene in one pass so the UI shows the jumps right after "Next Step"
+                players = scene.players
+                moves = list(moved.values())
+                for (idx, pos), px in zip(moves, scene._m2px_bulk(pos for _, pos in moves)):
+                    players[idx]['pos_m'] = [pos[0], pos[1]]
+                    scene._set_player_px(idx, px)
+                changed.update((lab, pos) for lab, (_, pos) in moved.items())  # ensure saved this step
 
         # ---------- Disc change ----------
         disc_pos = [float(scene.disc['pos_m'][0]), float(scene.disc['pos_m'][1])]
         prev_disc = prev_full.get('disc') if prev_full else None
-        disc_changed = prev_disc is None or (round(prev_disc[0], 6) != round(disc_pos[0], 6) or round(prev_disc[1], 6) != round(disc_pos[1], 6))
+        disc_changed = prev_disc is None or abs(prev_disc[0]-disc_pos[0]) > MOVE_EPS or abs(prev_disc[1]-disc_pos[1]) > MOVE_EPS
 
         # ---------- Save sparse entry ----------
         entry = {}
@@ -530,63 +673,98 @@ class RecordingManager:
         if disc_changed:
             entry['disc'] = disc_pos
 
-        self.data[t] = entry
+        self._put_step(t, entry)
         # Invalidate cached snapshots at and after this step
-        self._snapshot_cache = {k: v for k, v in self._snapshot_cache.items() if k < t}
+        self._invalidate_from(t)
 
     def next_step(self):
         self.step = float(int(self.step) + 1)
 
     def finish_recording(self, scene):
         self.save_step(scene)
-        self.max_step = float(max(self.data.keys()) if self.data else 0)
+        self.max_step = float(self._steps()[-1] if self.data else 0)
         self.state = 'playback'
         self.step = clamp(self.step, 0, self.max_step)
 
+    def _advance_to(self, target):
+        """Move the replay cursor to integer step `target`, applying only the deltas in between.
+
+        Scrubbing forward applies just the new steps; jumping backwards restarts
+        from the nearest keyframe at or before `target` (or from step 0).
+        """
+        if target == self._cursor_step:
+            return
+        K = self.KEYFRAME_EVERY
+        if target < self._cursor_step or self._cursor_step < 0:
+            k = target - target % K
+            while k > 0 and k not in self._keyframes:
+                k -= K
+            if k > 0:
+                players, disc, moves = self._keyframes[k]
+                self._cursor_players, self._cursor_disc, self._cursor_moves = dict(players), disc, dict(moves)
+                self._cursor_step = k
+            else:
+                base = self.data.get(0, {})
+                self._cursor_players = dict(base.get('players') or {})
+                self._cursor_disc = base.get('disc')
+                self._cursor_moves = {}
+                self._cursor_step = 0
+
+        # Stored [x, y] lists are never mutated in place (save_step/import always
+        # build new ones), so the cursor and snapshots share them.
+        data = self.data
+        has_links = bool(self.temp.get('links'))
+        if has_links and self._followers_cache is None:
+            self._rebuild_followers_cache()
+        follower_set = self._follower_set
+        keyframes = self._keyframes
+        players, moves = self._cursor_players, self._cursor_moves
+        disc = self._cursor_disc
+        for s in range(self._cursor_step+1, target+1):
+            entry = data.get(s)
+            if entry:
+                moved = entry.get('players')
+                if moved and not has_links:
+                    # No followers to resolve: the sparse entry is one bulk dict update
+                    players.update(moved)
+                elif moved:
+                    for lab, pos in moved.items():
+                        # Skip followers - build_snapshot resolves them from their leaders
+                        if lab in follower_set:
+                            continue
+                        # Leader moved - record the step
+                        if lab not in players or players[lab] != pos:
+                            moves[lab] = s
+                        players[lab] = pos
+                if 'disc' in entry:
+                    disc = entry['disc']
+            if s % K == 0 and s not in keyframes:
+                keyframes[s] = (dict(players), disc, dict(moves))
+        self._cursor_disc = disc
+        self._cursor_step = target
+
     def build_snapshot(self, step):
         """Return a full snapshot (players+disc) at integer `step` using cache.
 
         This composes the baseline step 0 snapshot with subsequent sparse deltas
-        and applies follower delays during playback.
+        (via the replay cursor) and applies follower delays during playback.
         """
         step = int(step)
         if step in self._snapshot_cache:
             return self._snapshot_cache[step]
 
-        # Start from step 0
-        base = self.data.get(0, {})
-        players = {}
-        if 'players' in base:
-            for k, v in base['players'].items():
-                players[k] = [float(v[0]), float(v[1])]
-
-        disc = None
-        if 'disc' in base:
-            disc = [float(base['disc'][0]), float(base['disc'][1])]
-
-        # Keep track of when each leader started moving for follower delays
-        move_starts = {}
-
-        # First pass: apply leader movements and track their start times
-        for s in range(1, step+1):
-            entry = self.data.get(s, {})
-            for lab, pos in entry.get('players', {}).items():
-                # Skip followers - we'll handle them in the second pass
-                if any(lab in fmap for fmap in self.temp.get('links', {}).values()):
-                    continue
-                # Leader moved - record the step
-                if lab not in players or players[lab] != pos:
-                    move_starts[lab] = s
-                players[lab] = [float(pos[0]), float(pos[1])]
-            if 'disc' in entry:
-                disc = [float(entry['disc'][0]), float(entry['disc'][1])]
-
-        # Second pass: apply follower movements with delays
+        self._advance_to(step)
+        players = dict(self._cursor_players)
+        disc = self._cursor_disc
+
+        # Apply follower movements with delays
         if self.temp.get('links'):
             # Rebuild cache if needed
             if self._followers_cache is None:
                 self._rebuild_followers_cache()
-            
+
+            # When each leader started moving, tracked by the cursor
+            move_starts = self._cursor_moves
             # Process each leader's followers
             for leader, followers in self._followers_cache.items():
                 leader_pos = players.get(leader)
@@ -599,20 +777,27 @@ class RecordingManager:
 
         snap = {'players': players, 'disc': disc}
         self._snapshot_cache[step] = snap
+        if step > self._cache_hi:
+            self._cache_hi = step
         return snap
 
     def update_playback(self, scene, t):
         if not self.data:
             return
         t = clamp(float(t), 0.0, self.max_step)
+        la = self._last_applied
+        if la is not None and la[0] == t and la[1] is scene._players_px \
+                and la[2] == scene._px_rev and la[3] == scene._disc_px:
+            self.step = t
+            return
 
         # Ensure scene players exist
         if not scene.players:
-            scene.players = scene._spawn_players()
+            scene._set_players(scene._spawn_players())
             scene._rebuild_px()
 
-        # Get player index map for fast updates
-        players_map = getattr(scene, '_player_index_map', {p['label']: idx for idx, p in enumerate(scene.players)})
+        # Label -> index map, kept in sync by Scene._set_players
+        players_map = scene._player_index_map
 
         i0 = int(math.floor(t))
         i1 = int(math.ceil(t))
@@ -627,34 +812,35 @@ class RecordingManager:
                 idx = players_map.get(lab)
                 if idx is not None:
                     scene.players[idx]['pos_m'] = [pos[0], pos[1]]
-                    scene._players_px[idx] = scene.m2px(pos[0], pos[1])
+            scene._players_px = scene._m2px_bulk(p['pos_m'] for p in scene.players)
             if snap0.get('disc'):
                 scene.disc['pos_m'] = [snap0['disc'][0], snap0['disc'][1]]
                 scene._disc_px = scene.m2px(snap0['disc'][0], snap0['disc'][1])
             self.step = t
+            self._last_applied = (t, scene._players_px, scene._px_rev, scene._disc_px)
             return
 
         # Non-integer interpolate
-        s0 = self.build_snapshot(i0)
-        s1 = self.build_snapshot(i1)
+        s0, s1 = snap0, snap1
         a = t - i0
-        players_map = getattr(scene, '_player_index_map', {p['label']: idx for idx, p in enumerate(scene.players)})
-
-        labs = set(list(s0.get('players', {}).keys()) + list(s1.get('players', {}).keys()))
-        for lab in labs:
-            p0 = s0.get('players', {}).get(lab)
-            p1 = s1.get('players', {}).get(lab)
-            if p0 is None and p1 is not None:
-                x, y = p1[0], p1[1]
-            elif p0 is not None and p1 is None:
-                x, y = p0[0], p0[1]
-            else:
-                x = p0[0] + a*(p1[0]-p0[0])
-                y = p0[1] + a*(p1[1]-p0[1])
+
+        p0d = s0.get('players') or {}
+        p1d = s1.get('players') or {}
+        p0_get, p1_get = p0d.get, p1d.get
+        players = scene.players
+        for lab in p0d.keys() | p1d.keys():
             idx = players_map.get(lab)
-            if idx is not None:
-                scene.players[idx]['pos_m'] = [x, y]
-                scene._players_px[idx] = scene.m2px(x, y)
+            if idx is None:
+                continue
+            p0 = p0_get(lab)
+            p1 = p1_get(lab)
+            # a label missing on one side holds still (the lerp collapses to the other end)
+            if p0 is None:
+                p0 = p1
+            elif p1 is None:
+                p1 = p0
+            players[idx]['pos_m'] = [p0[0] + a*(p1[0]-p0[0]), p0[1] + a*(p1[1]-p0[1])]
+        scene._players_px = scene._m2px_bulk(p['pos_m'] for p in players)
 
         if s0.get('disc') is not None or s1.get('disc') is not None:
             d0 = s0.get('disc') or s1.get('disc')
@@ -665,6 +851,7 @@ class RecordingManager:
             scene._disc_px = scene.m2px(dx, dy)
 
         self.step = t
+        self._last_applied = (t, scene._players_px, scene._px_rev, scene._disc_px)
 
 
 # ============ Scene ============
@@ -673,23 +860,34 @@ class Scene:
         self.scale = scale
         # Create empty caches first
         self._geo_px = None
-        self._grid_surf = None
+        self._grid_px = None
         self._font_ticks = None
         self._field_surf = None
+        self._field_key = None       # (id(font_ticks), scale, screen size) _field_surf was built for
         self._players_px = []
         self._disc_px = (0, 0)
-        
-        # Initialize data structures
-        self.players = self._spawn_players()
+        # spatial hash for pick(): (cx, cy) cell -> [player idx]; built for one _players_px list
+        self._player_grid = None
+        self._player_grid_src = None
+        self._player_cell = 1
+        self._px_rev = 0             # bumped by every in-place write to _players_px
+        self._pick_memo = None       # (mx, my, _players_px, _px_rev, _disc_px, tag) of the last pick()
+        # pre-rendered player discs: (team, is_selected) -> Surface, rebuilt on scale change
+        self._player_token_cache = {}
+
+        # Initialize data structures (_set_players also builds the label->index map
+        # and the per-index label/team columns)
+        self._set_players(self._spawn_players())
         self.disc = {"label": "DISC", "team": "Disc", "pos_m": [FIELD_LEN/2, CENTER_Y]}
         
-        # Player index map for fast label->index lookup
-        self._player_index_map = {}
-        
         # Linking and follow simulation state
         self.links = set()           # set of frozenset({label_a,label_b}) (undirected pairs)
+        self._link_idx_pairs = None  # [(idx_a, idx_b)] for draw(); None = rebuild from self.links
+        self._label_surfs = None     # per-index (label surface, half width, half height) for draw()
+        self._label_font = None
+        self._link_src_len = 0
         self.link_src = None         # temporary source when creating a link
-        self._follow_tasks = []      # [{'follower': idx, 'target': [x,y], 'start': [x,y], 'delay': secs, 'time': 0.0, 'duration': secs}]
+        self._follow_tasks = {}      # follower idx -> {'follower': idx, 'target': (x,y), 'start': (x,y), 'delay': secs, 'time': 0.0, 'duration': secs, 'inv_duration': 1/secs}
         self.follow_delay = 0.35     # seconds before follower starts moving
         self.follow_duration = 0.35  # seconds taken for follower to move to target
         
@@ -698,7 +896,6 @@ class Scene:
         
         # Initialize geometry and caches
         self._rebuild_px()
-        self._rebuild_index_map()
 
     def _spawn_players(self):
         pad, usable = 3.0, FIELD_WID-6
@@ -714,14 +911,64 @@ class Scene:
         return players
 
     def m2px(self, x, y):
-        return (MARGIN_L + int(round(x*self.scale)), MARGIN_T + int(round(y*self.scale)))
+        s = self.scale
+        return (MARGIN_L + int(round(x*s)), MARGIN_T + int(round(y*s)))
+
+    def _m2px_bulk(self, pts):
+        """m2px over an iterable of (x, y) metre pairs, with scale/margins bound once"""
+        s, ox, oy = self.scale, MARGIN_L, MARGIN_T
+        return [(ox + int(round(x*s)), oy + int(round(y*s))) for x, y in pts]
 
     def px2m(self, x, y):
         return ((x-MARGIN_L)/self.scale, (y-MARGIN_T)/self.scale)
 
+    def _set_players(self, players):
+        """Replace the roster and refresh everything indexed by player position in it"""
+        self.players = players
+        self._player_tags = [("player", i) for i in range(len(players))]
+        self._rebuild_index_map()
+        self._link_idx_pairs = None
+        self._label_surfs = None
+
+    def add_link(self, label_a, label_b):
+        """Link two players (undirected) and refresh the drawn link cache"""
+        self.links.add(frozenset([label_a, label_b]))
+        self._link_idx_pairs = None
+
+    def _build_label_surfs(self, font):
+        """Render each player's label once per font, converted for fast blits"""
+        surfs = []
+        for lab in self._labels:
+            try:
+                lbl = to_display_format(font.render(lab, True, (255,255,255)))
+            except Exception:
+                lbl = None
+            surfs.append((lbl, lbl.get_width()//2, lbl.get_height()//2) if lbl else (None, 0, 0))
+        self._label_surfs = surfs
+        self._label_font = font
+        return surfs
+
+    def _rebuild_link_cache(self):
+        """Resolve self.links to player index pairs once, for draw()"""
+        index_map = self._player_index_map
+        pairs = []
+        for pair in self.links:
+            if len(pair) != 2:
+                continue
+            a, b = pair
+            i1, i2 = index_map.get(a), index_map.get(b)
+            if i1 is not None and i2 is not None:
+                pairs.append((i1, i2))
+        self._link_idx_pairs = pairs
+        self._link_src_len = len(self.links)
+
     def _rebuild_index_map(self):
-        """Rebuild player label -> index lookup map"""
-        self._player_index_map = {p['label']: idx for idx, p in enumerate(self.players)}
+        """Rebuild player label -> index lookup map and the per-index label/team columns"""
+        players = self.players
+        self._player_index_map = {p['label']: idx for idx, p in enumerate(players)}
+        # parallel to self.players / self._players_px; only change when the roster does
+        self._labels = tuple(p['label'] for p in players)
+        self._teams = tuple("Blue" if p['team'] == "Blue" else "Red" for p in players)  # token colour
 
     def _schedule_follow(self, follower_idx, target_pos, delay=None, duration=None):
         """Schedule a follower to move to target position with delay"""
@@ -731,50 +978,51 @@ class Scene:
         delay = self.follow_delay if delay is None else delay
         duration = self.follow_duration if duration is None else duration
         
-        # Remove any existing task for this follower
-        self._follow_tasks = [t for t in self._follow_tasks if t['follower'] != follower_idx]
-        
-        # Add new task with start position
-        start_pos = list(self.players[follower_idx]['pos_m'])
+        # Add new task with start position (replaces any existing task for this follower)
         task = {
             'follower': follower_idx,
-            'start': start_pos,
-            'target': [float(target_pos[0]), float(target_pos[1])],
+            'start': tuple(self.players[follower_idx]['pos_m']),
+            'target': (float(target_pos[0]), float(target_pos[1])),
             'delay': float(delay),
             'time': 0.0,
-            'duration': float(duration)
+            'duration': float(duration),
+            'inv_duration': 1.0 / max(0.001, float(duration))
         }
-        self._follow_tasks.append(task)
+        self._follow_tasks[follower_idx] = task
     
     def update(self, dt):
         """Update follow movements (call in main loop). dt is seconds."""
         if not self._follow_tasks:
             return
             
-        remaining = []
-        for task in self._follow_tasks:
+        # Positions are stepped in one pass; pixels are converted together afterwards
+        players = self.players
+        moved_idx, moved_pos = [], []
+        finished = []
+        for idx, task in self._follow_tasks.items():
             task['time'] += dt
-            if task['time'] >= task['delay']:
-                # Start moving after delay
-                progress = (task['time'] - task['delay']) / max(0.001, task['duration'])
-                if progress >= 1.0:
-                    # Finished moving
-                    self.players[task['follower']]['pos_m'] = list(task['target'])
-                    self._players_px[task['follower']] = self.m2px(*task['target'])
-                else:
-                    # Interpolate position
-                    start = task['start']
-                    target = task['target']
-                    pos = [
-                        start[0] + (target[0] - start[0]) * progress,
-                        start[1] + (target[1] - start[1]) * progress
-                    ]
-                    self.players[task['follower']]['pos_m'] = list(pos)
-                    self._players_px[task['follower']] = self.m2px(*pos)
-                    remaining.append(task)
+            if task['time'] < task['delay']:
+                continue
+            # Start moving after delay
+            progress = (task['time'] - task['delay']) * task['inv_duration']
+            if progress >= 1.0:
+                # Finished moving
+                target = task['target']
+                pos = players[idx]['pos_m'] = [target[0], target[1]]
+                finished.append(idx)
             else:
-                remaining.append(task)
-        self._follow_tasks = remaining
+                # Interpolate position in place (pos_m lists are never shared)
+                start = task['start']
+                target = task['target']
+                pos = players[idx]['pos_m']
+                pos[0] = start[0] + (target[0] - start[0]) * progress
+                pos[1] = start[1] + (target[1] - start[1]) * progress
+            moved_idx.append(idx)
+            moved_pos.append(pos)
+        for i, px in zip(moved_idx, self._m2px_bulk(moved_pos)):
+            self._set_player_px(i, px)
+        for idx in finished:
+            del self._follow_tasks[idx]
 
     def _rebuild_px(self):
         s = self.scale
@@ -802,53 +1050,96 @@ class Scene:
             "gL": (gxL,top,gxL,bot), "gR": (gxR,top,gxR,bot),
             "boundary": boundary, "bricks": bricks
         }
-
-        self._players_px = [self.m2px(p["pos_m"][0], p["pos_m"][1]) for p in self.players]
+        # Hover hit-lines are all axis-aligned: (name, fixed coord, lo, hi) in hover priority order
+        self._goal_vsegs = (("Goal Line (Left)", gxL, top, bot), ("Goal Line (Right)", gxR, top, bot))
+        self._vsegs = tuple((n, x1, y1, y2) for n, (x1, y1, x2, y2) in boundary.items() if x1 == x2)
+        self._hsegs = tuple((n, y1, x1, x2) for n, (x1, y1, x2, y2) in boundary.items() if x1 != x2)
+
+        # Grid: pixel x of every metre column, y of every row, and the field extent (m2px is affine per axis)
+        self._grid_px = (
+            [MARGIN_L + int(round(xm*s)) for xm in range(int(FIELD_LEN)+1)],
+            [MARGIN_T + int(round(ym*s)) for ym in range(int(FIELD_WID)+1)],
+            (*self.m2px(0, 0), *self.m2px(FIELD_LEN, FIELD_WID)),
+        )
+
+        self._players_px = self._m2px_bulk(p["pos_m"] for p in self.players)
         self._disc_px = self.m2px(*self.disc["pos_m"])
+        # the roster columns are kept by _set_players; assign rosters through it
+        assert len(self._labels) == len(self.players), "Scene.players replaced without _set_players()"
 
-        # Player index map for fast label->index lookup
-        self._player_index_map = {p['label']: idx for idx, p in enumerate(self.players)}
+        # Player tokens depend on the radius, so rebuild them with the geometry
+        self._build_player_tokens()
+
+        # Static background is rasterized lazily by draw() (it needs the screen size and tick font)
+        self._field_surf = None
+        self._field_key = None
 
-        # Build cached static field surface (background, endzones, bricks, border)
+    def _build_field_surf(self, size, font_ticks):
+        """Rasterize everything static (background, field, endzones, goal lines,
+        bricks, border, grid and tick labels) into one opaque screen-sized surface."""
+        self._font_ticks = font_ticks
+        g = self._geo_px
+        field_rect = g["field"]
         try:
+            static = pygame.Surface(size).convert()
+            static.fill(COL['bg'])
             fw, fh = field_rect.width, field_rect.height
             surf = pygame.Surface((fw, fh), pygame.SRCALPHA)
             surf.fill(COL['field'])
             # endzones (relative)
-            ez_w = int(round(ENDZONE * self.scale))
+            ez_w = g["ezL"].width
             ezL_rel = pygame.Rect(0, 0, ez_w, fh)
             ezR_rel = pygame.Rect(fw - ez_w, 0, ez_w, fh)
             pygame.draw.rect(surf, COL['ez'], ezL_rel)
             pygame.draw.rect(surf, COL['ez'], ezR_rel)
-            # gentle tint overlay to endzones for depth
-            tint = pygame.Surface((ezL_rel.width, ezL_rel.height), pygame.SRCALPHA)
-            tint.fill((0,0,0,40))
-            surf.blit(tint, (ezL_rel.left, ezL_rel.top))
-            surf.blit(tint, (ezR_rel.left, ezR_rel.top))
+            # gentle tint to endzones for depth: darken in place instead of blitting a
+            # (0,0,0,40) overlay; a 212 multiply gives the same pixels for COL['ez']
+            surf.fill((212,212,212), ezL_rel, special_flags=pygame.BLEND_RGB_MULT)
+            surf.fill((212,212,212), ezR_rel, special_flags=pygame.BLEND_RGB_MULT)
             # goal lines (relative x)
-            gxL_rel = gxL - field_rect.left
-            gxR_rel = gxR - field_rect.left
+            gxL_rel = g["gL"][0] - field_rect.left
+            gxR_rel = g["gR"][0] - field_rect.left
             # goal line with faint glow behind
             for w in (6,4):
                 pygame.draw.line(surf, COL['line'] if w==4 else (230,230,230), (gxL_rel, 0), (gxL_rel, fh), w)
                 pygame.draw.line(surf, COL['line'] if w==4 else (230,230,230), (gxR_rel, 0), (gxR_rel, fh), w)
             # bricks (relative coords)
-            for _, (bx, by) in bricks.items():
+            for _, (bx, by) in g["bricks"].items():
                 rx, ry = bx - field_rect.left, by - field_rect.top
                 pygame.draw.circle(surf, COL['brick'], (rx, ry), 6)
                 pygame.draw.circle(surf, (0,0,0), (rx, ry), 6, 1)
             # border
             pygame.draw.rect(surf, COL['line'], surf.get_rect(), 3, border_radius=4)
-            self._field_surf = surf
+            static.blit(surf, field_rect.topleft)
+            self._grid(static, font_ticks)
+            self._field_surf = static
         except Exception:
             self._field_surf = None
 
+    def _build_player_tokens(self):
+        """Pre-render the player discs (fill, inner ring, outline) once per team/selection."""
+        pr = max(5, int(0.35*self.scale))
+        c = pr + 1
+        self._player_token_cache = {}
+        for team, col in (("Blue", COL['blue']), ("Red", COL['red'])):
+            for is_sel in (False, True):
+                tok = pygame.Surface((2*c+1, 2*c+1), pygame.SRCALPHA)
+                pygame.draw.circle(tok, col, (c, c), pr)
+                pygame.draw.circle(tok, (255,255,255), (c, c), max(1, pr-2), 2)
+                pygame.draw.circle(tok, (0,0,0), (c, c), pr, 3 if is_sel else 2)
+                self._player_token_cache[(team, is_sel)] = to_display_format(tok)
+        # hover halo (selection ring + 1px drop outline) drawn under the hovered token
+        h = pr + 7
+        halo = pygame.Surface((2*h+1, 2*h+1), pygame.SRCALPHA)
+        pygame.draw.circle(halo, COL['sel'], (h, h), pr+6, 2)
+        pygame.draw.circle(halo, (0,0,0), (h, h+1), pr, 1)
+        self._player_token_cache['hover'] = to_display_format(halo)
+
     def on_scale_change(self, scale, font_ticks):
         if abs(scale-self.scale) < 1e-9:
             return
         self.scale = scale
         self._font_ticks = font_ticks
-        self._grid_surf = None
         self._rebuild_px()
 
     def move_entity(self, tag, nx, ny):
@@ -870,10 +1161,10 @@ class Scene:
         if tag[0] == "player":
             i = tag[1]
             self.players[i]["pos_m"] = [nx, ny]
-            self._players_px[i] = self.m2px(nx, ny)
+            self._update_player_px(i)
             
             # Schedule linked followers to move
-            leader_label = self.players[i]["label"]
+            leader_label = self._labels[i]
             for pair in self.links:
                 if leader_label in pair:
                     # Get the other label in the pair (the follower)
@@ -883,52 +1174,44 @@ class Scene:
                         follower_idx = self._player_index_map.get(follower_label)
                         if follower_idx is not None:
                             # Schedule follower to move to leader's position
-                            self._schedule_follow(follower_idx, [nx, ny])
+                            self._schedule_follow(follower_idx, (nx, ny))
         else:
             self.disc["pos_m"] = [nx, ny]
             self._disc_px = self.m2px(nx, ny)
 
     def _grid(self, surface, font_ticks):
-        if self._grid_surf and self._font_ticks is font_ticks:
-            surface.blit(self._grid_surf, (0,0))
-            return
-
-        self._font_ticks = font_ticks
+        """Draw grid lines and tick labels onto `surface` (via an alpha layer so the soft lines blend)."""
         grid = pygame.Surface((surface.get_width(), surface.get_height()), pygame.SRCALPHA)
 
+        xs, ys, (left, top, right, bot) = self._grid_px
+        line = pygame.draw.line
+
         # Minor lines (softer)
         minor_col = (*COL['grid_minor'][:3], 70)
-        for xm in range(int(FIELD_LEN)+1):
-            x1, y1 = self.m2px(xm, 0)
-            x2, y2 = self.m2px(xm, FIELD_WID)
-            pygame.draw.line(grid, minor_col, (x1,y1), (x2,y2))
-        for ym in range(int(FIELD_WID)+1):
-            x1, y1 = self.m2px(0, ym)
-            x2, y2 = self.m2px(FIELD_LEN, ym)
-            pygame.draw.line(grid, minor_col, (x1,y1), (x2,y2))
+        for x in xs:
+            line(grid, minor_col, (x,top), (x,bot))
+        for y in ys:
+            line(grid, minor_col, (left,y), (right,y))
 
         # Major lines (thicker for 5-marks)
         major_col = (*COL['grid_major'][:3], 180)
-        for xm in range(0, int(FIELD_LEN)+1, 5):
-            x1, y1 = self.m2px(xm, 0)
-            x2, y2 = self.m2px(xm, FIELD_WID)
-            pygame.draw.line(grid, major_col, (x1,y1), (x2,y2), 2)
-        for ym in range(0, int(FIELD_WID)+1, 5):
-            x1, y1 = self.m2px(0, ym)
-            x2, y2 = self.m2px(FIELD_LEN, ym)
-            pygame.draw.line(grid, major_col, (x1,y1), (x2,y2), 2)
+        for x in xs[::5]:
+            line(grid, major_col, (x,top), (x,bot), 2)
+        for y in ys[::5]:
+            line(grid, major_col, (left,y), (right,y), 2)
 
         # Ticks
+        render, blit, tick_col = font_ticks.render, grid.blit, COL['tick']
+        field = self._geo_px["field"]
         for xm in range(0, int(FIELD_LEN)+1, 10):
-            tx, _ = self.m2px(xm, 0)
-            lbl = font_ticks.render(str(xm), True, COL['tick'])
-            grid.blit(lbl, (tx-lbl.get_width()//2, self._geo_px["field"].top+4))
+            tx = xs[xm]
+            lbl = render(str(xm), True, tick_col)
+            blit(lbl, (tx-lbl.get_width()//2, field.top+4))
         for ym in range(0, int(FIELD_WID)+1, 10):
-            _, ty = self.m2px(0, ym)
-            lbl = font_ticks.render(str(ym), True, COL['tick'])
-            grid.blit(lbl, (self._geo_px["field"].left+4, ty-lbl.get_height()//2))
+            ty = ys[ym]
+            lbl = render(str(ym), True, tick_col)
+            blit(lbl, (field.left+4, ty-lbl.get_height()//2))
 
-        self._grid_surf = grid
         surface.blit(grid, (0,0))
 
     def draw(self, screen, font_ticks, selected=None, hover=None):
@@ -937,91 +1220,173 @@ class Scene:
             selected = self._sel
 
         g = self._geo_px
-        # Blit cached static field surface
-        if getattr(self, '_field_surf', None):
-            screen.blit(self._field_surf, (g['field'].left, g['field'].top))
+        line, circle = pygame.draw.line, pygame.draw.circle
+        # Blit cached static background (field + grid); built once per scale/size/font
+        # (self._font_ticks keeps the font alive, so its id can't be recycled under the key)
+        size = screen.get_size()
+        key = (id(font_ticks), self.scale, size)
+        if self._field_key != key:
+            self._build_field_surf(size, font_ticks)
+            self._field_key = key
+        if self._field_surf is not None:
+            screen.blit(self._field_surf, (0,0))
         else:
+            screen.fill(COL['bg'])
             pygame.draw.rect(screen, COL['field'], g["field"], 0, border_radius=4)
             pygame.draw.rect(screen, COL['ez'], g["ezL"])
             pygame.draw.rect(screen, COL['ez'], g["ezR"])
             for seg in (g["gL"], g["gR"]):
-                pygame.draw.line(screen, COL['line'], (seg[0],seg[1]), (seg[2],seg[3]), 4)
+                line(screen, COL['line'], (seg[0],seg[1]), (seg[2],seg[3]), 4)
             for _, (bx,by) in g["bricks"].items():
-                pygame.draw.circle(screen, COL['brick'], (bx,by), 6)
-                pygame.draw.circle(screen, (0,0,0), (bx,by), 6, 1)
+                circle(screen, COL['brick'], (bx,by), 6)
+                circle(screen, (0,0,0), (bx,by), 6, 1)
             pygame.draw.rect(screen, COL['line'], g["field"], 3, border_radius=4)
-
-        self._grid(screen, font_ticks)
-
-        # Draw links between players
-        for pair in self.links:
-            labels = list(pair)
-            idx1 = self._player_index_map.get(labels[0])
-            idx2 = self._player_index_map.get(labels[1])
-            if idx1 is not None and idx2 is not None:
-                x1, y1 = self._players_px[idx1]
-                x2, y2 = self._players_px[idx2]
-                # Draw link line with glow effect
-                pygame.draw.line(screen, (255,255,255,40), (x1,y1), (x2,y2), 4)
-                pygame.draw.line(screen, COL['accent'], (x1,y1), (x2,y2), 2)
-
-        # Players
+            self._grid(screen, font_ticks)
+
+        # Draw links between players (index pairs cached; the length check also
+        # catches pairs added straight to self.links instead of via add_link)
+        if self._link_idx_pairs is None or self._link_src_len != len(self.links):
+            self._rebuild_link_cache()
+        pts = self._players_px
+        accent = COL['accent']
+        for idx1, idx2 in self._link_idx_pairs:
+            x1, y1 = pts[idx1]
+            x2, y2 = pts[idx2]
+            # Draw link line with glow effect
+            line(screen, (255,255,255,40), (x1,y1), (x2,y2), 4)
+            line(screen, accent, (x1,y1), (x2,y2), 2)
+
+        # Players: pre-rendered hover halo, tokens and labels go out in one blits() batch
+        # (batch order is stacking order)
         pr = max(5, int(0.35*self.scale))
-        for i, p in enumerate(self.players):
-            x, y = self._players_px[i]
-            col = COL['blue'] if p["team"]=="Blue" else COL['red']
-            is_hover = (hover == ("player", i) and selected is None)
-            is_sel = (selected == ("player", i))
-            if is_hover:
-                pygame.draw.circle(screen, COL['sel'], (x, y), pr+6, 2)
-                pygame.draw.circle(screen, (0,0,0), (x, y+1), pr, 1)
-            pygame.draw.circle(screen, col, (x, y), pr)
-            inner_r = max(1, pr-2)
-            pygame.draw.circle(screen, (255,255,255), (x, y), inner_r, 2)
-            outline_w = 3 if is_sel else 2
-            pygame.draw.circle(screen, (0,0,0), (x, y), pr, outline_w)
-            try:
-                lbl = font_ticks.render(p.get('label',''), True, (255,255,255))
-                screen.blit(lbl, (x - lbl.get_width()//2, y - lbl.get_height()//2))
-            except Exception:
-                pass
+        c, h = pr + 1, pr + 7
+        tokens = self._player_token_cache
+        hover_i = hover[1] if (hover and hover[0] == "player" and selected is None) else None
+        sel_i = selected[1] if (selected and selected[0] == "player") else None
+        teams = self._teams
+        label_surfs = self._label_surfs
+        if label_surfs is None or self._label_font is not font_ticks:
+            label_surfs = self._build_label_surfs(font_ticks)
+        batch = []
+        for i, (x, y) in enumerate(self._players_px):
+            if i == hover_i:
+                batch.append((tokens['hover'], (x-h, y-h)))
+            batch.append((tokens.get((teams[i], i == sel_i)), (x-c, y-c)))
+            lbl, hw, hh = label_surfs[i]
+            if lbl is not None:
+                batch.append((lbl, (x - hw, y - hh)))
+        screen.blits(batch, 0)
 
         # Disc
         dx, dy = self._disc_px
         dr = max(5, int(DISC_R*self.scale))
-        pygame.draw.circle(screen, (30,30,30), (dx,dy), dr+2)
-        pygame.draw.circle(screen, (240,240,240), (dx,dy), dr)
-        pygame.draw.circle(screen, (0,0,0), (dx,dy), dr, 2)
+        circle(screen, (30,30,30), (dx,dy), dr+2)
+        circle(screen, (240,240,240), (dx,dy), dr)
+        circle(screen, (0,0,0), (dx,dy), dr, 2)
         if hover==("disc",None) and selected is None:
-            pygame.draw.circle(screen, COL['sel'], (dx,dy), dr+6, 2)
-            if self._players_px:
-                best = None
-                bestd = 1e9
-                for px, py in self._players_px:
-                    d = math.hypot(px-dx, py-dy)
-                    if d < bestd:
-                        bestd = d
-                        best = (px, py)
-                if best is not None:
-                    tx, ty = best
-                    ax = int(dx + 0.5*(tx-dx))
-                    ay = int(dy + 0.5*(ty-dy))
-                    pygame.draw.line(screen, (50,50,50), (dx,dy), (ax,ay), 3)
-                    pygame.draw.circle(screen, (50,50,50), (ax,ay), 3)
+            circle(screen, COL['sel'], (dx,dy), dr+6, 2)
+            best = self._nearest_player(dx, dy)
+            if best is not None:
+                tx, ty = self._players_px[best]
+                ax = int(dx + 0.5*(tx-dx))
+                ay = int(dy + 0.5*(ty-dy))
+                line(screen, (50,50,50), (dx,dy), (ax,ay), 3)
+                circle(screen, (50,50,50), (ax,ay), 3)
 
     def pick(self, mx, my):
-        dr = max(5, int(DISC_R*self.scale))
-        if math.hypot(mx-self._disc_px[0], my-self._disc_px[1]) <= dr+6:
-            return ("disc", None)
-
-        pr = max(5, int(0.35*self.scale))
-        best, bestd = None, 1e9
-        for i, (x,y) in enumerate(self._players_px):
-            d = math.hypot(mx-x, my-y)
-            if d <= pr+6 and d < bestd:
-                best, bestd = ("player", i), d
+        # a stationary cursor over an unmoved scene gets the previous answer
+        m = self._pick_memo
+        if m is not None and m[0] == mx and m[1] == my and m[2] is self._players_px \
+                and m[3] == self._px_rev and m[4] == self._disc_px:
+            return m[5]
+        tag = self._pick(mx, my)
+        self._pick_memo = (mx, my, self._players_px, self._px_rev, self._disc_px, tag)
+        return tag
+
+    def _pick(self, mx, my):
+        # squared distances against squared radii: no sqrt per candidate
+        dr = max(5, int(DISC_R*self.scale)) + 6
+        ddx, ddy = mx-self._disc_px[0], my-self._disc_px[1]
+        if ddx*ddx + ddy*ddy <= dr*dr:
+            return DISC_TAG
+
+        # players: only the 3x3 cells around the cursor can hold a hit (cell side >= pick radius)
+        if self._player_grid is None or self._player_grid_src is not self._players_px:
+            self._build_player_grid()
+        pr = max(5, int(0.35*self.scale)) + 6
+        r2 = pr*pr
+        grid, pts, cell = self._player_grid, self._players_px, self._player_cell
+        cx, cy = mx//cell, my//cell
+        best, bestd = None, r2
+        for gx in (cx-1, cx, cx+1):
+            for gy in (cy-1, cy, cy+1):
+                for i in grid.get((gx, gy), ()):
+                    x, y = pts[i]
+                    d = (mx-x)*(mx-x) + (my-y)*(my-y)
+                    # nearest wins; equal distances go to the lower index, like a linear scan
+                    if d < bestd or (d == bestd and (best is None or i < best)):
+                        best, bestd = i, d
+        return None if best is None else self._player_tags[best]
+
+    def _nearest_player(self, x, y):
+        """Index of the player nearest (x, y) in pixels, searching the pick grid ring by ring;
+        same answer as a linear scan of _players_px by squared distance (lowest index on ties)."""
+        if self._player_grid is None or self._player_grid_src is not self._players_px:
+            self._build_player_grid()
+        grid, pts, cell = self._player_grid, self._players_px, self._player_cell
+        if not grid:
+            return None
+        cx, cy = x//cell, y//cell
+        best, bestd = None, None
+        seen, r = 0, 0
+        # stop once every player was seen, or ring r (at least (r-1)*cell away) can't beat the best
+        while seen < len(pts) and (bestd is None or ((r-1)*cell)**2 <= bestd):
+            for gx in range(cx-r, cx+r+1):
+                step = 1 if gx in (cx-r, cx+r) else 2*r
+                for gy in range(cy-r, cy+r+1, step or 1):
+                    bucket = grid.get((gx, gy), ())
+                    seen += len(bucket)
+                    for i in bucket:
+                        px, py = pts[i]
+                        d = (px-x)*(px-x) + (py-y)*(py-y)
+                        if bestd is None or d < bestd or (d == bestd and i < best):
+                            best, bestd = i, d
+            r += 1
         return best
 
+    def _build_player_grid(self):
+        """Hash every player's pixel position into square cells sized to the pick radius."""
+        self._player_cell = cell = max(5, int(0.35*self.scale)) + 6
+        grid = {}
+        for i, (x, y) in enumerate(self._players_px):
+            grid.setdefault((x//cell, y//cell), []).append(i)
+        self._player_grid = grid
+        self._player_grid_src = self._players_px
+
+    def _update_player_px(self, i):
+        """Refresh one player's cached pixel position from its pos_m"""
+        x, y = self.players[i]["pos_m"]
+        s = self.scale
+        self._set_player_px(i, (MARGIN_L + int(round(x*s)), MARGIN_T + int(round(y*s))))
+
+    def _set_player_px(self, i, px):
+        """Write one player's pixel position, moving it between hash cells if the grid is live."""
+        old = self._players_px[i]
+        self._players_px[i] = px
+        self._px_rev += 1
+        grid = self._player_grid
+        if grid is None or self._player_grid_src is not self._players_px:
+            return
+        cell = self._player_cell
+        ok, nk = (old[0]//cell, old[1]//cell), (px[0]//cell, px[1]//cell)
+        if ok != nk:
+            bucket = grid.get(ok)
+            if bucket is not None and i in bucket:
+                bucket.remove(i)
+                if not bucket:
+                    del grid[ok]
+            grid.setdefault(nk, []).append(i)
+
     # ---------- NEW: tiny UI glue so you can link by clicking ----------
     # These helpers *do not* force changes to your main loop; they’re optional.
     def handle_click_for_linking(self, mx, my, recording_manager, delay_steps=1):
@@ -1054,17 +1419,25 @@ class Scene:
     def hover_text_generic(self, mx, my):
         g = self._geo_px
         for name, (bx,by) in g["bricks"].items():
-            if math.hypot(mx-bx, my-by) <= 10:
+            if (mx-bx)**2 + (my-by)**2 <= 100:
                 return name
-        for name, seg in [("Goal Line (Left)", g["gL"]), ("Goal Line (Right)", g["gR"])]:
-            if dist_point_seg(mx, my, *seg) <= 6:
+        # within 6px of an axis-aligned segment: perpendicular offset plus overshoot past the ends
+        for name, x, y0, y1 in self._goal_vsegs:
+            dx, dy = mx-x, (y0-my if my < y0 else my-y1 if my > y1 else 0)
+            if dx*dx + dy*dy <= 36:
                 return name
         if g["ezL"].collidepoint(mx, my):
             return "End Zone (Left)"
         if g["ezR"].collidepoint(mx, my):
             return "End Zone (Right)"
-        for name, seg in g["boundary"].items():
-            if dist_point_seg(mx, my, *seg) <= 6:
+        # sidelines come before endlines in g["boundary"], so corners resolve the same way
+        for name, x, y0, y1 in self._vsegs:
+            dx, dy = mx-x, (y0-my if my < y0 else my-y1 if my > y1 else 0)
+            if dx*dx + dy*dy <= 36:
+                return name
+        for name, y, x0, x1 in self._hsegs:
+            dx, dy = (x0-mx if mx < x0 else mx-x1 if mx > x1 else 0), my-y
+            if dx*dx + dy*dy <= 36:
                 return name
         return None
 
@@ -1079,7 +1452,8 @@ def export_csv(scene, filename=None, logger=None):
         logger.log_system_event("export_position", {"filename": name})
     
     try:
-        with open(path, "w", newline="") as f:
+        with open(path, "wb", buffering=EXPORT_BUFFER) as raw, \
+                io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
             w = csv.writer(f)
             w.writerow(CSV_HEADERS)
             for p in scene.players:
@@ -1091,6 +1465,59 @@ def export_csv(scene, filename=None, logger=None):
         print("[Export] ERROR:", e)
         return None
 
+class _LogRecords:
+    """Stand-in logger for worker threads: keeps (event, details) system events so the
+    main loop can hand them to the real logger, which is only ever used from that thread."""
+    def __init__(self):
+        self.records = []
+
+    def log_system_event(self, event, details):
+        self.records.append((event, details))
+
+class ExportWorker:
+    """Runs CSV exports on one background thread so disk I/O never stalls the frame loop.
+    Each job is called as fn(*args, logger=records); the CSV_DONE event it posts carries
+    the job's kind, resulting path and those log records (`log`)."""
+    def __init__(self):
+        self._q = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="csv-export", daemon=True)
+        self._thread.start()
+
+    def submit(self, kind, fn, *args):
+        self._q.put((kind, fn, args))
+
+    def _run(self):
+        while True:
+            job = self._q.get()
+            if job is None:
+                return
+            kind, fn, args = job
+            records = _LogRecords()
+            try:
+                path = fn(*args, logger=records)
+            except Exception as e:
+                print("[Export] ERROR:", e)
+                records.log_system_event(f"export_{kind}_error", {"error": str(e)})
+                path = None
+            try:
+                pygame.event.post(pygame.event.Event(CSV_DONE, kind=kind, path=path, log=records.records))
+            except pygame.error:
+                pass  # display already shut down
+
+    def close(self):
+        """Finish queued exports, then stop the thread"""
+        self._q.put(None)
+        self._thread.join()
+
+def export_snapshot(scene=None, recorder=None):
+    """Detached copy of what export_csv/export_strategy read, safe to hand to ExportWorker
+    while the UI keeps editing. Recorded step entries are never mutated in place, so a
+    shallow copy of recorder.data is enough."""
+    if scene is not None:
+        return SimpleNamespace(players=[{**p, 'pos_m': list(p['pos_m'])} for p in scene.players],
+                               disc={**scene.disc, 'pos_m': list(scene.disc['pos_m'])})
+    return SimpleNamespace(data=dict(recorder.data), _sorted_steps=list(recorder._steps()))
+
 def export_strategy(recorder, filename=None, logger=None):
     name = filename or f"strategy_{time.strftime('%Y%m%d_%H%M%S')}.csv"
     name = ensure_csv_ext(name)
@@ -1100,24 +1527,32 @@ def export_strategy(recorder, filename=None, logger=None):
         logger.log_system_event("export_strategy", {"filename": name, "total_steps": len(recorder.data)})
     
     try:
-        with open(path, "w", newline="") as f:
+        with open(path, "wb", buffering=EXPORT_BUFFER) as raw, \
+                io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
             w = csv.writer(f)
             # Sparse format: step, entity, label, x_m, y_m
             w.writerow(["step", "entity", "label", "x_m", "y_m"])
 
-            for step in sorted(recorder.data.keys()):
-                snap = recorder.data[step]
-                # players is a dict keyed by label in the new format
-                for label, pos in (snap.get('players') or {}).items():
-                    try:
-                        x, y = float(pos[0]), float(pos[1])
-                        w.writerow([step, "player", label, f"{x:.6f}", f"{y:.6f}"])
-                    except Exception:
-                        continue
+            steps = getattr(recorder, '_sorted_steps', None)
+            if steps is None or len(steps) != len(recorder.data):
+                steps = sorted(recorder.data.keys())
+
+            def rows():
+                for step in steps:
+                    snap = recorder.data[step]
+                    # players is a dict keyed by label in the new format
+                    for label, pos in (snap.get('players') or {}).items():
+                        try:
+                            x, y = float(pos[0]), float(pos[1])
+                        except Exception:
+                            continue
+                        yield (step, "player", label, f"{x:.6f}", f"{y:.6f}")
+
+                    if snap.get('disc') is not None:
+                        dx, dy = snap['disc']
+                        yield (step, "disc", "DISC", f"{float(dx):.6f}", f"{float(dy):.6f}")
 
-                if 'disc' in snap and snap.get('disc') is not None:
-                    dx, dy = snap['disc']
-                    w.writerow([step, "disc", "DISC", f"{float(dx):.6f}", f"{float(dy):.6f}"])
+            w.writerows(rows())
 
         if logger:
             logger.log_system_event("export_strategy_success", {"filename": name, "path": path})
@@ -1150,7 +1585,7 @@ def import_csv(scene, filename):
         return False
     
     if players:
-        scene.players = players
+        scene._set_players(players)
     if disc:
         scene.disc = disc
     scene._rebuild_px()
@@ -1165,27 +1600,44 @@ def import_strategy(recorder, scene, filename, logger=None):
         print(f"[Import Strategy] Reading file: {filename}")
         raw = {}
         with open(path, "r", newline="") as f:
-            for row in csv.DictReader(f):
+            reader = csv.reader(f)
+            header = next(reader, None) or []
+            n = len(header)
+            col = {name: i for i, name in enumerate(header)}
+            # Columns missing from the header read their default from a tail appended to each row
+            tail, idx = [], []
+            for key, default in (("step", 0), ("entity", ""), ("label", ""), ("x_m", 0.0), ("y_m", 0.0)):
+                i = col.get(key)
+                if i is None:
+                    i = n + len(tail)
+                    tail.append(default)
+                idx.append(i)
+            i_step, i_ent, i_label, i_x, i_y = idx
+            _int, _float, _clamp, fl, fw = int, float, clamp, FIELD_LEN, FIELD_WID
+
+            for row in reader:
+                if not row:
+                    continue  # blank line
+                if len(row) != n or tail:
+                    # short rows read None for the missing cells, extra cells are ignored
+                    row = (row + [None]*(n-len(row)))[:n] + tail
                 try:
-                    step = int(row.get("step", 0))
+                    step = _int(row[i_step])
                 except Exception:
                     continue
-                ent = row.get("entity", "").lower()
-                label = row.get("label", "")
+                ent = row[i_ent].lower()
+                label = row[i_label]
                 try:
-                    x = clamp(float(row.get("x_m", 0.0)), 0.0, FIELD_LEN)
-                    y = clamp(float(row.get("y_m", 0.0)), 0.0, FIELD_WID)
+                    x = _clamp(_float(row[i_x]), 0.0, fl)
+                    y = _clamp(_float(row[i_y]), 0.0, fw)
                 except Exception:
                     continue
 
-                if step not in raw:
-                    raw[step] = {}
+                entry = raw.setdefault(step, {})
                 if ent == "player":
-                    if 'players' not in raw[step]:
-                        raw[step]['players'] = {}
-                    raw[step]['players'][label] = [x, y]
+                    entry.setdefault('players', {})[label] = [x, y]
                 elif ent == 'disc':
-                    raw[step]['disc'] = [x, y]
+                    entry['disc'] = [x, y]
         
         if raw:
             print(f"[Import Strategy] Successfully imported {len(raw)} steps")
@@ -1195,12 +1647,14 @@ def import_strategy(recorder, scene, filename, logger=None):
                 })
 
             recorder.data = raw
-            recorder.max_step = float(max(raw.keys()))
+            recorder._sorted_steps = sorted(raw)
+            recorder._invalidate_from(0)
+            recorder.max_step = float(recorder._sorted_steps[-1])
             recorder.state = 'playback'
             recorder.step = 0.0
 
             # Rebuild scene base positions
-            scene.players = scene._spawn_players()
+            scene._set_players(scene._spawn_players())
             scene._rebuild_px()
 
             # Apply step 0 if present
@@ -1215,30 +1669,45 @@ def import_strategy(recorder, scene, filename, logger=None):
         return False
 
 # ============ Tooltip ============
-def draw_tip(surf, font, text, pos):
-    if not text:
-        return
+@functools.lru_cache(maxsize=64)
+def _tip_parts(font, text):
+    """Bubble background and (label, dx, dy) lines for one tooltip text; shared, only blit them."""
     lines = text.split('\n')
     labels = [font.render(ln, True, (240,240,240)) for ln in lines]
     pad = (8,6)
     w = max(lbl.get_width() for lbl in labels) + 2*pad[0]
     h = sum(lbl.get_height() for lbl in labels) + 2*pad[1] + (len(labels)-1)*2
-    x, y = pos[0]+14, pos[1]+12
     bg = pygame.Surface((w,h+8), pygame.SRCALPHA)
     pygame.draw.rect(bg, (10,10,12,220), pygame.Rect(0,0,w,h), border_radius=8)
     # small pointer triangle under bubble
     pygame.draw.polygon(bg, (10,10,12,220), [(16,h),(20,h+6),(12,h+6)])
-    surf.blit(bg, (x,y))
-    yy = y + pad[1]
+    parts = []
+    yy = pad[1]
     for lbl in labels:
-        surf.blit(lbl, (x+pad[0], yy))
+        parts.append((lbl, pad[0], yy))
         yy += lbl.get_height()+2
+    return bg, tuple(parts)
+
+def draw_tip(surf, font, text, pos):
+    if not text:
+        return
+    bg, parts = _tip_parts(font, text)
+    x, y = pos[0]+14, pos[1]+12
+    surf.blit(bg, (x,y))
+    for lbl, dx, dy in parts:
+        surf.blit(lbl, (x+dx, y+dy))
 
 # ============ Main ============
 def main():
     pygame.init()
     screen = pygame.display.set_mode((WIN_W, WIN_H))
     pygame.display.set_caption("Ultimate Field — Optimized")
+    # only the events the loop handles get queued; SDL drops the rest (window, text, wheel, touch...)
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                              pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, CSV_DONE, LOG_SAVED])
+    # exposes carry no handler, but as events they force a full redraw of an idle frame
+    pygame.event.set_allowed([pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED])
     clock = pygame.time.Clock()
     linking_mode = False  # Initialize linking mode state
     
@@ -1246,12 +1715,12 @@ def main():
     font_ticks = pygame.font.SysFont("Arial", 12)
     font_ui = pygame.font.SysFont("Arial", 18, bold=True)
     
-    logger = UFCLogger()
+    logger = UFCLogger(on_saved=post_log_saved)
     scene = Scene(compute_scale(WIN_W, WIN_H))
     is_fullscreen = False
 
     def toggle_fullscreen():
-        nonlocal screen, is_fullscreen, scene, slider, rec_bar_rect
+        nonlocal screen, is_fullscreen, scene, slider, rec_bar_rect, rec_bar_surf
         is_fullscreen = not is_fullscreen
         if is_fullscreen:
             screen = pygame.display.set_mode((0,0), pygame.FULLSCREEN)
@@ -1270,6 +1739,7 @@ def main():
         rb_y_local = rec_bar_rect.top + 12
         # move slider width to fit new width but keep right-side margin for step label
         slider.rect = pygame.Rect(MARGIN_L, rb_y_local+40, ww-2*MARGIN_L-220, 18)
+        rec_bar_surf = build_rec_bar()
     
     # UI setup
     btn_w, btn_h, pad = 180, 36, 14
@@ -1289,6 +1759,29 @@ def main():
     rec_bar_rect = pygame.Rect(0, WIN_H-UI_BAR_H-RECORD_BAR_H, WIN_W, RECORD_BAR_H)
     rb_y = rec_bar_rect.top + 12
     
+    def build_rec_bar():
+        # recording bar with its translucent shadow band, top-left at (left, top-4);
+        # drawn straight onto the alpha surface, so bar pixels stay opaque and the
+        # rounded corners keep the shadow. Depends only on the bar rect.
+        surf = pygame.Surface((rec_bar_rect.width, rec_bar_rect.height+6), pygame.SRCALPHA)
+        surf.fill((0,0,0,90))
+        ox, oy = rec_bar_rect.left, rec_bar_rect.top-4
+        pygame.draw.rect(surf, (24,24,28), rec_bar_rect.move(-ox, -oy), border_radius=10)
+        pygame.draw.line(surf, (0,0,0), (-ox, 4), (WIN_W-ox, 4), 2)
+        return to_display_format(surf)
+    rec_bar_surf = build_rec_bar()
+    
+    # HUD legend (top-left) never changes: chips + labels drawn once onto a transparent strip
+    legend_chips = [(COL['blue'], 'Offense'), (COL['red'], 'Defense'), ((200,180,40), 'Brick')]
+    legend_w = sum(18 + font_ticks.size(lab)[0] + 10 for _, lab in legend_chips)
+    legend = pygame.Surface((legend_w, max(14, font_ticks.get_linesize())), pygame.SRCALPHA)
+    ox = 0
+    for colc, lab in legend_chips:
+        pygame.draw.rect(legend, colc, (ox, 2, 12, 12), border_radius=3)
+        legend.blit(font_ticks.render(lab, True, (220,220,220)), (ox+18, 0))
+        ox += 18 + font_ticks.size(lab)[0] + 10
+    legend = to_display_format(legend)
+    
     rec_buttons = {
         'record': make_button((MARGIN_L, rb_y, 150, 36), "Record Play", icon='⏺', primary=True),
         'next': make_button((MARGIN_L, rb_y, 130, 36), "Next Step", icon='⏭'),
@@ -1296,6 +1789,8 @@ def main():
         'newrec': make_button((MARGIN_L, rb_y, 170, 36), "New Recording", icon='🆕'),
         'linking': make_button((MARGIN_L+320, rb_y, 160, 36), "Linking Mode: Off", icon='🔗'),
     }
+    # fixed set of buttons for hover updates (visibility toggles don't change membership)
+    all_buttons = (*buttons.values(), *rec_buttons.values())
     
     # Linking mode state
     linking_mode = False
@@ -1315,18 +1810,50 @@ def main():
     set_mode_ui(recorder.state)
     
     toasts = Toasts()
+    exporter = ExportWorker()
     picker = Picker(font_ui)
     dlg = ExportDialog(font_ui, font_ticks)
     
     dragging = selected = None
     drag_off = (0.0, 0.0)
+    drag_to = None  # latest cursor position of a drag not yet applied to the scene
     mouse = (0, 0)
+    # what the cursor was over on the last drawn frame (hover highlight, tooltip)
+    pick_for_frame = None
+    # (mouse, scale, text) of the last generic hover lookup; the field lines never move
+    tip_memo = None
+    # ((state, max_step, fps), label surface, blit position) of the top-right status line
+    status = (None, None, None)
+    
+    def status_rect():
+        return pygame.Rect(status[2], status[1].get_size()) if status[1] else None
+    
+    def apply_drag():
+        # motion only records the cursor; the drag target moves once, to its latest position
+        nonlocal drag_to
+        if drag_to is not None:
+            nx, ny = scene.px2m(*drag_to)
+            scene.move_entity(dragging, nx+drag_off[0], ny+drag_off[1])
+            drag_to = None
     
     running = True
     while running:
-        for e in pygame.event.get():
+        events = pygame.event.get()
+        for e in events:
+            if e.type != pygame.MOUSEMOTION:
+                # anything else may read or replace the scene: settle the pending drag first
+                apply_drag()
             if e.type == pygame.QUIT:
                 running = False
+            elif e.type == CSV_DONE:
+                for event, details in e.log:
+                    logger.log_system_event(event, details)
+                if e.path:
+                    toasts.show(f"Exported {e.kind}: {os.path.basename(e.path)}")
+                continue
+            elif e.type == LOG_SAVED:
+                show_log_saved(e, toasts)
+                continue
             elif e.type == pygame.KEYDOWN:
                 # fullscreen toggle (F11 or 'f')
                 if e.key == pygame.K_F11 or e.key == pygame.K_f:
@@ -1344,14 +1871,11 @@ def main():
             if dlg.visible:
                 name = dlg.handle(e)
                 if name:
+                    # written in the background; the toast comes with the CSV_DONE event
                     if dlg.mode == "position":
-                        path = export_csv(scene, name, logger)
-                        if path:
-                            toasts.show(f"Exported position: {os.path.basename(path)}")
+                        exporter.submit("position", export_csv, export_snapshot(scene=scene), name)
                     else:
-                        path = export_strategy(recorder, name, logger)
-                        if path:
-                            toasts.show(f"Exported strategy: {os.path.basename(path)}")
+                        exporter.submit("strategy", export_strategy, export_snapshot(recorder=recorder), name)
                 continue
             
             if picker.visible:
@@ -1380,12 +1904,11 @@ def main():
             
             if e.type == pygame.MOUSEMOTION:
                 mouse = e.pos
-                for b in list(buttons.values()) + list(rec_buttons.values()):
+                for b in all_buttons:
                     b.update(mouse)
                 
                 if dragging and recorder.state != 'playback':
-                    nx, ny = scene.px2m(*e.pos)
-                    scene.move_entity(dragging, nx+drag_off[0], ny+drag_off[1])
+                    drag_to = e.pos
             
             elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
                 # Recording buttons
@@ -1431,7 +1954,7 @@ def main():
                     picker.visible = True
                     continue
                 if buttons['savelog'].clicked(e.pos):
-                    handle_save_log(logger, toasts)
+                    handle_save_log(logger)
                     continue
                 
                 # Toggle linking mode
@@ -1445,6 +1968,7 @@ def main():
                 
                 # Entity picking & linking
                 if recorder.state != 'playback':
+                    # Scene.pick memoizes: a click where the cursor hovered costs nothing
                     tag = scene.pick(*e.pos)
                     if tag and tag[0] == "player":
                         if linking_mode:
@@ -1461,7 +1985,7 @@ def main():
                                     follower_idx = tag[1]
                                     leader = scene.players[leader_idx]["label"]
                                     follower = scene.players[follower_idx]["label"]
-                                    scene.links.add(frozenset([leader, follower]))
+                                    scene.add_link(leader, follower)
                                     toasts.show(f"Linked {leader} → {follower}", kind="success")
                                 scene._sel = None
                                 selected = None
@@ -1483,11 +2007,25 @@ def main():
             elif e.type == pygame.MOUSEBUTTONUP and e.button == 1:
                 dragging = None
         
+        apply_drag()
+        
         # Update & Render
+        # sampled before update(): the frame a follow move finishes still has to be drawn
+        moving = bool(scene._follow_tasks)
         dt = clock.get_time() / 1000.0  # Get time since last frame in seconds
         scene.update(dt)  # Update follow movement
-        
-        screen.fill(COL['bg'])
+
+        # Everything on screen comes from input, follow moves, the time-based overlays
+        # (toast expiry, dialog caret, picker refresh) or the FPS figure. With none of
+        # those the previous frame is still current, so skip rendering and presenting it.
+        full = bool(events) or moving or bool(toasts.q) or dlg.visible or picker.visible
+        fps = int(clock.get_fps())
+        if not full and status[0] == (recorder.state, recorder.max_step, fps):
+            clock.tick(60)
+            continue
+
+        # One (monotonic) clock read per frame, shared by the time-based overlays
+        now = time.monotonic()
 
         # Compute pick once per frame and reuse
         if recorder.state != 'playback':
@@ -1495,20 +2033,17 @@ def main():
         else:
             pick_for_frame = None
 
+        # scene.draw starts with a full-screen static background blit, so no screen.fill() is needed
         scene.draw(screen, font_ticks, selected=selected, hover=pick_for_frame)
 
         # Recording bar shadow + bar (rounded top corners)
-        shadow = pygame.Surface((rec_bar_rect.width, rec_bar_rect.height+6), pygame.SRCALPHA)
-        shadow.fill((0,0,0,90))
-        screen.blit(shadow, (rec_bar_rect.left, rec_bar_rect.top-4))
-        pygame.draw.rect(screen, (24,24,28), rec_bar_rect, border_radius=10)
-        pygame.draw.line(screen, (0,0,0), (0, rec_bar_rect.top), (WIN_W, rec_bar_rect.top), 2)
+        screen.blit(rec_bar_surf, (rec_bar_rect.left, rec_bar_rect.top-4))
 
         for b in rec_buttons.values():
             b.draw(screen, font_ui)
 
         disp = int(round(recorder.step)) if abs(recorder.step-round(recorder.step))<1e-6 else f"{recorder.step:.2f}"
-        step_lbl = font_ui.render(f"Step: {disp}", True, (235,235,235))
+        step_lbl = render_text(font_ui, f"Step: {disp}", (235,235,235))
         screen.blit(step_lbl, (rec_bar_rect.right - step_lbl.get_width() - MARGIN_L, rec_bar_rect.top + 10))
 
         if recorder.state == 'playback':
@@ -1523,46 +2058,48 @@ def main():
         lx = MARGIN_L
         ly = MARGIN_T//2
         small = font_ticks
-        # legend chips
-        chips = [(COL['blue'], 'Offense'), (COL['red'], 'Defense'), ((200,180,40), 'Brick')]
-        ox = lx
-        for colc, lab in chips:
-            pygame.draw.rect(screen, colc, (ox, ly, 12, 12), border_radius=3)
-            screen.blit(small.render(lab, True, (220,220,220)), (ox+18, ly-2))
-            ox += 18 + small.size(lab)[0] + 10
-
-        # status (top-right)
-        status_x = WIN_W - MARGIN_L
-        mode = recorder.state or 'Idle'
-        steps = f"Steps: {int(recorder.max_step)+1 if recorder.max_step else 0}"
-        fps = f"FPS: {int(clock.get_fps())}"
-        stext = f"Mode: {mode}  •  {steps}  •  {fps}"
-        s_lbl = small.render(stext, True, (200,200,200))
-        screen.blit(s_lbl, (status_x - s_lbl.get_width(), ly-2))
+        screen.blit(legend, (lx, ly-2))
+
+        # status (top-right): text and position are laid out again only when an input changes
+        dirty = [status_rect()]
+        if status[0] != (recorder.state, recorder.max_step, fps):
+            mode = recorder.state or 'Idle'
+            steps = f"Steps: {int(recorder.max_step)+1 if recorder.max_step else 0}"
+            stext = f"Mode: {mode}  •  {steps}  •  FPS: {fps}"
+            s_lbl = render_text(small, stext, (200,200,200))
+            status = ((recorder.state, recorder.max_step, fps), s_lbl, (WIN_W - MARGIN_L - s_lbl.get_width(), ly-2))
+        screen.blit(status[1], status[2])
+        dirty.append(status_rect())
         
         # Overlays
         if picker.visible:
             picker.draw(screen)
         if dlg.visible:
-            dlg.draw(screen)
+            dlg.draw(screen, now)
 
         # Tooltip (use pick_for_frame computed earlier)
         if recorder.state != 'playback':
-            tag = pick_for_frame
-            if tag:
-                if tag[0] == "player":
-                    p = scene.players[tag[1]]
+            if pick_for_frame:
+                if pick_for_frame[0] == "player":
+                    p = scene.players[pick_for_frame[1]]
                     draw_tip(screen, font_tip, f"{p['team']} Player ({p['label']})", mouse)
                 else:
                     draw_tip(screen, font_tip, "Frisbee (DISC)", mouse)
             else:
-                gtxt = scene.hover_text_generic(*mouse)
-                draw_tip(screen, font_tip, gtxt, mouse)
+                if tip_memo is None or tip_memo[0] != mouse or tip_memo[1] != scene.scale:
+                    tip_memo = (mouse, scene.scale, scene.hover_text_generic(*mouse))
+                draw_tip(screen, font_tip, tip_memo[2], mouse)
         
-        toasts.draw(screen, font_ui)
-        pygame.display.flip()
+        toasts.draw(screen, font_ui, now)
+        if full or dirty[0] is None:
+            pygame.display.flip()
+        else:
+            # only the status line changed: present its old and new rectangles
+            pygame.display.update(dirty)
         clock.tick(60)
     
+    exporter.close()
+    logger.close()
     pygame.quit()
     sys.exit()
 
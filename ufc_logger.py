@@ -1,32 +1,168 @@
 import os
+import io
+import gzip
 import json
 import time
+import queue
+import threading
+import traceback
+from collections import namedtuple
+from array import array
 from datetime import datetime
 
-class UFCLogger:
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
+# Log files are written through a buffer of this size, in slices no larger than it
+WRITE_BUFFER = 1 << 20
+
+# Log categories, in the order they are written to a saved file
+CATEGORIES = ('events', 'user_actions', 'system_events', 'errors', 'playback_events', 'recording_events')
+
+def _json_default(obj):
+    """Serialize the non-JSON values that end up in event details (sets of links, objects)."""
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    # events are serialized when logged, so an odd value must not raise in the caller
+    return str(obj)
+
+def _dumps(obj, pretty=False):
+    """Serialize obj to UTF-8 JSON bytes (orjson when available); compact unless pretty."""
+    if orjson is not None:
+        # non-str dict keys are stringified, as the stdlib json module does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=_json_default, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, default=_json_default).encode("utf-8")
+    return json.dumps(obj, separators=(',', ':'), default=_json_default).encode("utf-8")
+
+class _EventColumns:
+    """One category's events stored column-wise instead of one dict per event
+    
+    ts: microseconds since the epoch, types: ids into the logger's type table,
+    details: concatenated JSON of each event's details, ends: end offset of each one.
+    """
+    __slots__ = ('ts', 'types', 'details', 'ends')
+    
     def __init__(self):
-        self.log_data = {
-            'session_start': datetime.now().isoformat(),
-            'events': [],
-            'user_actions': [],
-            'system_events': [],
-            'errors': [],
-            'playback_events': [],
-            'recording_events': []
-        }
+        self.ts = array('q')
+        self.types = array('H')
+        self.details = bytearray()
+        self.ends = array('Q')
+    
+    def __len__(self):
+        return len(self.ts)
+    
+    def copy(self):
+        c = _EventColumns()
+        c.ts, c.types, c.ends = self.ts[:], self.types[:], self.ends[:]
+        c.details = bytes(self.details)
+        return c
+    
+    def rows(self, type_json):
+        """Yield each event as a JSON object (bytes)
+        
+        Timestamps are local ISO times, as datetime.isoformat() gives them; the date and
+        time part is formatted once per second (kept local: saves run on worker threads).
+        """
+        details = memoryview(self.details)
+        start = 0
+        last_sec, stamp = None, b''
+        for ts, tid, end in zip(self.ts, self.types, self.ends):
+            sec, us = divmod(ts, 1_000_000)
+            if sec != last_sec:
+                last_sec = sec
+                stamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec)).encode()
+            yield b''.join((b'{"timestamp":"', stamp, b'.%06d' % us if us else b'', b'","type":', type_json[tid],
+                            b',"details":', details[start:end], b'}'))
+            start = end
+
+# One queued save: a consistent copy of the log plus where and how to write it
+_SaveJob = namedtuple('SaveJob', ['filepath', 'session_start', 'sections', 'type_json',
+                                  'session_end', 'stats', 'pretty'])
+
+# Queued instead of a _SaveJob when nothing changed: report the last written path
+# to on_saved once the saves ahead of it are done
+_REPORT_LAST = object()
+
+def _render_log(job):
+    """Yield the saved JSON document, in pieces, from a _SaveJob's event columns
+    
+    Each event goes on its own line; details are spliced in already serialized.
+    """
+    type_json = job.type_json
+    yield b'{"session_start":' + _dumps(job.session_start)
+    for category, cols in job.sections.items():
+        yield b',\n' + _dumps(category) + b':[\n'
+        sep = b''
+        for row in cols.rows(type_json):
+            yield sep
+            yield row
+            sep = b',\n'
+        yield b'\n]'
+    yield b',\n"session_end":' + _dumps(job.session_end) + b',\n"stats":' + _dumps(job.stats) + b'}\n'
+
+def _write_chunks(f, chunks):
+    """Write byte chunks to f; oversized ones go out as WRITE_BUFFER-sized memoryview slices"""
+    for chunk in chunks:
+        if len(chunk) <= WRITE_BUFFER:
+            f.write(chunk)
+        else:
+            mv = memoryview(chunk)
+            for i in range(0, len(mv), WRITE_BUFFER):
+                f.write(mv[i:i+WRITE_BUFFER])
+
+class UFCLogger:
+    def __init__(self, compress=True, on_saved=None):
+        # gzip saved logs (level 1: fast, several times smaller than plain JSON)
+        self.compress = compress
+        # on_saved(filepath, error) is called from the worker thread once per save_log call:
+        # error is None on success; filepath is None if nothing has been saved yet
+        self.on_saved = on_saved
+        self.session_start = datetime.now().isoformat()
+        # category -> _EventColumns (append-only)
+        self._columns = {c: _EventColumns() for c in CATEGORIES}
+        # running per-category event counts for the stats block
+        self._counts = dict.fromkeys(CATEGORIES, 0)
+        # event type strings interned to small ids; _type_json[id] is the serialized string
+        self._type_ids = {}
+        self._type_json = []
         self.last_save = time.time()
         self.changed = False
+        # last file written successfully (set by the worker)
+        self._last_path = None
+        # guards the columns, counts and type table: the save worker logs its errors
+        # from its own thread, and save_log snapshots everything at once
+        self._lock = threading.Lock()
+        # saves are assembled and written by a background thread: _SaveJob items
+        self._q = queue.Queue()
+        self._worker = threading.Thread(target=self._drain, daemon=True)
+        self._worker.start()
         
     def _add_event(self, category, event_type, details):
         """Add an event to the specified category"""
-        if category not in self.log_data:
-            self.log_data[category] = []
+        data = _dumps(details)
+        with self._lock:
+            self._append(category, event_type, data)
+    
+    def _append(self, category, event_type, data):
+        """Append an event with already-serialized details; the caller holds _lock"""
+        cols = self._columns.get(category)
+        if cols is None:
+            cols = self._columns[category] = _EventColumns()
+            self._counts[category] = 0
+        tid = self._type_ids.get(event_type)
+        if tid is None:
+            tid = self._type_ids[event_type] = len(self._type_json)
+            self._type_json.append(_dumps(event_type))
             
-        self.log_data[category].append({
-            'timestamp': datetime.now().isoformat(),
-            'type': event_type,
-            'details': details
-        })
+        cols.ts.append(time.time_ns() // 1000)
+        cols.types.append(tid)
+        cols.details += data
+        cols.ends.append(len(cols.details))
+        self._counts[category] += 1
         self.changed = True
         
     def log_event(self, event_type, details):
@@ -71,46 +207,96 @@ class UFCLogger:
         """Log a recording-related event"""
         self._add_event('recording_events', event, details)
         
-    def save_log(self, force=False):
-        """Save log data if changed or forced
+    def save_log(self, force=False, pretty=False, note=None):
+        """Queue a save of the log data; the file is written by the background worker
+        
+        Args:
+            force: Write a new file even if nothing was logged since the last save
+            pretty: Indent the JSON (slower, larger); the default is one event per line
+            note: System event type to record the save under ({"filepath": ...});
+                it is included in the saved file and does not count as a change
         
         Returns:
-            str: Path to saved log file if successful, otherwise raises an exception
+            str: Path the log file is being written to; the last written file's path
+            (None if there is none yet) when nothing changed and force is False
         """
-        if not (self.changed or force):
-            # If no changes and not forced, create a new save anyway
-            force = True
+        with self._lock:
+            if not (self.changed or force):
+                if self.on_saved is not None:
+                    self._q.put(_REPORT_LAST)
+                return self._last_path
             
-        # Create logs directory if it doesn't exist
-        log_dir = os.path.join("logs")
-        os.makedirs(log_dir, exist_ok=True)
-        
-        # Save with timestamp
-        filename = f"ufc_log_{time.strftime('%Y%m%d_%H%M%S')}.json"
-        filepath = os.path.join(log_dir, filename)
-        
-        try:
-            # Add session end time
-            self.log_data['session_end'] = datetime.now().isoformat()
+            # Save with timestamp
+            filename = f"ufc_log_{time.strftime('%Y%m%d_%H%M%S')}.json"
+            if self.compress:
+                filename += ".gz"
+            filepath = os.path.join("logs", filename)
+            if note is not None:
+                self._append('system_events', note, _dumps({"filepath": filepath}))
             
-            # Add statistics
-            self.log_data['stats'] = {
-                'total_events': len(self.log_data['events']),
-                'total_actions': len(self.log_data['user_actions']),
-                'total_system_events': len(self.log_data['system_events']),
-                'total_errors': len(self.log_data['errors']),
-                'total_playback': len(self.log_data['playback_events']),
-                'total_recording': len(self.log_data['recording_events'])
+            counts = self._counts
+            stats = {
+                'total_events': counts['events'],
+                'total_actions': counts['user_actions'],
+                'total_system_events': counts['system_events'],
+                'total_errors': counts['errors'],
+                'total_playback': counts['playback_events'],
+                'total_recording': counts['recording_events']
             }
             
-            # Save to file
-            with open(filepath, 'w') as f:
-                json.dump(self.log_data, f, indent=2)
-            
+            # the worker formats from copies, so logging can carry on while it writes
+            sections = {c: cols.copy() for c, cols in self._columns.items()}
+            type_json = list(self._type_json)
             self.changed = False
             self.last_save = time.time()
-            print(f"[Log] Saved to {filepath}")
-            return filepath
-        except Exception as e:
-            print(f"[Log] Error saving: {e}")
-            return None
+        
+        self._q.put(_SaveJob(filepath, self.session_start, sections, type_json,
+                             datetime.now().isoformat(), stats, pretty))
+        print(f"[Log] Saving to {filepath}")
+        return filepath
+    
+    def _drain(self):
+        """Worker loop: serialize and write queued _SaveJobs until the None sentinel"""
+        while True:
+            item = self._q.get()
+            if item is None:
+                return
+            if item is _REPORT_LAST:
+                with self._lock:
+                    filepath = self._last_path
+                self._report(filepath, None)
+                continue
+            filepath = item.filepath
+            try:
+                # Create logs directory if it doesn't exist
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                chunks = _render_log(item)
+                if item.pretty:
+                    chunks = (_dumps(json.loads(b''.join(chunks)), pretty=True),)
+                # pieces are small, so the buffer turns them into a few large writes
+                # (or, for .gz, a few large compress calls)
+                if filepath.endswith(".gz"):
+                    f = io.BufferedWriter(gzip.GzipFile(filepath, 'wb', compresslevel=1), WRITE_BUFFER)
+                else:
+                    f = open(filepath, 'wb', buffering=WRITE_BUFFER)
+                with f:
+                    _write_chunks(f, chunks)
+            except Exception as e:
+                # recorded with the rest of the log (the lock makes this safe from here);
+                # it marks the log changed, so the next save writes it out
+                self.log_error("save_log_error", str(e), traceback.format_exc())
+                self._report(filepath, e)
+                continue
+            with self._lock:
+                self._last_path = filepath
+            self._report(filepath, None)
+    
+    def _report(self, filepath, error):
+        if self.on_saved is not None:
+            self.on_saved(filepath, error)
+    
+    def close(self):
+        """Write pending saves and stop the worker"""
+        if self._worker.is_alive():
+            self._q.put(None)
+            self._worker.join()